@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Flag duplicate definitions under src/.
+
+Walks the source tree and reports:
+  - two files that would resolve to the same import path
+  - classes defining the same method name twice (the later definition
+    silently shadows the earlier one)
+  - modules defining the same top-level function twice
+
+Exits non-zero when anything is flagged, so it can run as a pre-commit
+check.
+"""
+
+import ast
+import sys
+from collections import Counter
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+
+def iter_duplicates(names):
+    """Yield names appearing more than once."""
+    counts = Counter(names)
+    for name, count in counts.items():
+        if count > 1:
+            yield name, count
+
+
+def check_file(path):
+    """Return a list of problem strings for one source file."""
+    problems = []
+    tree = ast.parse(path.read_text(), filename=str(path))
+
+    top_level = [n.name for n in tree.body
+                 if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    for name, count in iter_duplicates(top_level):
+        problems.append(f"{path}: function '{name}' defined {count} times")
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        methods = [n.name for n in node.body
+                   if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        for name, count in iter_duplicates(methods):
+            problems.append(
+                f"{path}: {node.name}.{name} defined {count} times")
+
+    return problems
+
+
+def main():
+    problems = []
+
+    # Two files resolving to the same import path (e.g. a stray copy
+    # shadowing a package module)
+    import_paths = {}
+    for path in sorted(SRC.rglob('*.py')):
+        module = '.'.join(path.relative_to(SRC).with_suffix('').parts)
+        if module.endswith('.__init__'):
+            module = module[:-len('.__init__')]
+        if module in import_paths:
+            problems.append(
+                f"{path} and {import_paths[module]} both resolve to "
+                f"'{module}'")
+        else:
+            import_paths[module] = path
+
+        problems.extend(check_file(path))
+
+    for problem in problems:
+        print(problem)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
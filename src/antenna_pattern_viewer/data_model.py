@@ -144,7 +144,10 @@ class PatternDataModel(QObject):
         
         # Update current pattern
         self._pattern = processed
-        logger.info("Processing applied to pattern")
+        # Fires on every processing change; keep it off the hot path
+        # unless debug logging is actually on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing applied to pattern")
         self.pattern_modified.emit(processed)
     
     def set_phase_center_translation(self, translation: Optional[list]):
@@ -378,16 +381,6 @@ class PatternDataModel(QObject):
             'num_comparison': len(comparison)
         }
 
-    def update_view_params(self, params: Dict[str, Any]):
-        """
-        Update view parameters and emit signal.
-        
-        Args:
-            params: Dictionary of view parameters to update
-        """
-        self._view_params.update(params)
-        self.view_parameters_changed.emit(self._view_params)
-
     def set_theta_origin_shift(self, theta_offset: Optional[float]):
         """
         Enable or disable theta origin shift.
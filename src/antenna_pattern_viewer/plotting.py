@@ -315,10 +315,6 @@ def plot_multiple_patterns(
     Returns:
         tuple: (fig, ax) The figure and axes objects
     """
-    import matplotlib.pyplot as plt
-    import numpy as np
-    import matplotlib.lines as mlines
-    
     # Create new figure and axes if not provided
     if ax is None:
         fig, ax = plt.subplots(figsize=fig_size)
@@ -533,9 +529,6 @@ def plot_pattern_difference(
         ValueError: If patterns have incompatible dimensions
         ValueError: If value_type is invalid
     """
-    import matplotlib.pyplot as plt
-    import numpy as np
-    
     # Create new figure and axes if not provided
     if ax is None:
         fig, ax = plt.subplots(figsize=fig_size)
@@ -815,40 +808,46 @@ def plot_pattern_statistics(
     else:
         raise ValueError(f"Invalid statistic_over: {statistic_over}. Must be 'phi' or 'frequency'")
     
-    # Transpose data to have shape [dimension, theta]
-    # When statistic_over='phi', dimension represents different phi angles
-    # When statistic_over='frequency', dimension represents different frequencies
-    all_data = data.T if statistic_over == 'phi' else data
-    
+    # Reduce directly along the statistic dimension instead of transposing
+    # up front. When statistic_over='phi', data is [theta, phi] so the phi
+    # dimension is axis 1; when statistic_over='frequency', data is
+    # [freq, theta] so the frequency dimension is axis 0. Passing axis=
+    # keeps the reductions aligned with the data's native strides.
+    reduce_axis = 1 if statistic_over == 'phi' else 0
+    n_cuts = data.shape[reduce_axis]
+
     # Calculate statistics across the dimension (phi or frequency)
-    mean_data = np.mean(all_data, axis=0)
-    median_data = np.median(all_data, axis=0)
-    std_data = np.std(all_data, axis=0)
-    min_data = np.min(all_data, axis=0)
-    max_data = np.max(all_data, axis=0)
-    
+    mean_data = np.mean(data, axis=reduce_axis)
+    median_data = np.median(data, axis=reduce_axis)
+    std_data = np.std(data, axis=reduce_axis)
+    min_data = np.min(data, axis=reduce_axis)
+    max_data = np.max(data, axis=reduce_axis)
+
     # For RMS, we need to square values, mean, then sqrt
-    rms_data = np.sqrt(np.mean(all_data**2, axis=0))
+    rms_data = np.sqrt(np.mean(data**2, axis=reduce_axis))
+
 
-    
     # Calculate percentiles if needed
-    lower_percentile = np.percentile(all_data, percentile_range[0], axis=0)
-    upper_percentile = np.percentile(all_data, percentile_range[1], axis=0)
-    
+    lower_percentile = np.percentile(data, percentile_range[0], axis=reduce_axis)
+    upper_percentile = np.percentile(data, percentile_range[1], axis=reduce_axis)
+
     # Plot individual cuts if requested
     if show_individual:
-        for i in range(len(all_data)):
+        # Row iteration needs the statistic dimension first; swapaxes is a
+        # view, so this costs nothing when reduce_axis is already 0
+        cuts = data.swapaxes(0, reduce_axis)
+        for i in range(n_cuts):
             if statistic_over == 'phi':
                 label = f"φ={dimension_values[i]:.1f}°"
             else:
                 label = f"{dimension_values[i]:.2f} GHz"
-                
+
             # Only add to legend if there aren't too many lines
-            if len(all_data) > 10:
+            if n_cuts > 10:
                 label = "_nolegend_"
-                
-            ax.plot(theta, all_data[i], 
-                   alpha=alpha_individual, 
+
+            ax.plot(theta, cuts[i],
+                   alpha=alpha_individual,
                    linewidth=0.8,
                    label=label)
     
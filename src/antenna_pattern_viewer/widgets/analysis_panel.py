@@ -7,14 +7,15 @@ including Spherical Wave Expansion and Near Field evaluation.
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
     QComboBox, QPushButton, QDoubleSpinBox, QCheckBox,
-    QScrollArea, QSpinBox, QTextEdit, QSizePolicy
+    QScrollArea, QSpinBox, QPlainTextEdit, QSizePolicy
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QThreadPool, QTimer
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 import numpy as np
+from collections import OrderedDict
+import atexit
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +39,35 @@ class AnalysisPanel(QWidget):
         super().__init__(parent)
         self.data_model = data_model
         self.current_pattern = None
+        self._has_swe = False
         self.swe_calculated = False
         self.nearfield_data = None
         self.swe_worker = None
+        self._swe_busy = False
+        self._thread_pool = QThreadPool.globalInstance()
+        self.nf_worker = None
+        self._nf_cache = OrderedDict()
+        self._nf_pending_key = None
+        # Frequency of the most recently calculated SWE, so near-field
+        # launches skip the key lookup on the happy path
+        self._last_swe_freq = None
+        # exp(i m phi) tables keyed by (MMAX, phi_points); repeat
+        # evaluations at different radii reuse the same phasors
+        self._phasor_cache = {}
+        # 'single' halves near-field memory; 'double' for full precision
+        self._precision = 'single'
+        # Power plot deferred while the panel is hidden
+        self._pending_plot = None
 
         self.setup_ui()
         self.connect_signals()
 
+        # The memmap temp files are created with delete=False; make
+        # sure whatever is live at interpreter exit is unlinked (the
+        # panel lives for the whole session, so the bound-method
+        # reference held by atexit is harmless)
+        atexit.register(self._release_nf_memmaps)
+
     def setup_ui(self):
         """Setup the analysis panel UI."""
         # Create scroll area
@@ -110,19 +133,20 @@ class AnalysisPanel(QWidget):
         self.calculate_swe_btn.clicked.connect(self.on_calculate_swe)
         swe_layout.addWidget(self.calculate_swe_btn)
 
-        # Results display
-        self.swe_results = QTextEdit()
+        # Results display; QPlainTextEdit skips the rich-text document
+        # machinery QTextEdit drags in for what is plain text anyway
+        self.swe_results = QPlainTextEdit()
         self.swe_results.setReadOnly(True)
         self.swe_results.setMaximumHeight(150)
         self.swe_results.setPlaceholderText("SWE results will appear here...")
         swe_layout.addWidget(self.swe_results)
 
-        # Power per mode plot
-        self.power_figure = Figure(figsize=(4, 3))
-        self.power_canvas = FigureCanvas(self.power_figure)
-        self.power_canvas.setMinimumHeight(280)
-        self.power_canvas.setVisible(False)
-        swe_layout.addWidget(self.power_canvas)
+        # Power per mode plot; the figure/canvas (and with them the
+        # matplotlib import) are created on first use so cold launches
+        # that never compute SWE skip matplotlib entirely
+        self.power_figure = None
+        self.power_canvas = None
+        self._swe_layout = swe_layout
 
         layout.addWidget(swe_group)
 
@@ -142,6 +166,12 @@ class AnalysisPanel(QWidget):
         surface_row.addStretch()
         nf_layout.addLayout(surface_row)
 
+        # Evaluate the surface at every SWE frequency in one batch
+        self.nf_all_freqs_check = QCheckBox("All frequencies")
+        self.nf_all_freqs_check.setToolTip(
+            "Evaluate the surface at every frequency with SWE data")
+        nf_layout.addWidget(self.nf_all_freqs_check)
+
         # Spherical surface controls
         self.sphere_controls_widget = QWidget()
         sphere_layout = QVBoxLayout(self.sphere_controls_widget)
@@ -178,66 +208,10 @@ class AnalysisPanel(QWidget):
 
         nf_layout.addWidget(self.sphere_controls_widget)
 
-        # Planar surface controls
-        self.plane_controls_widget = QWidget()
-        plane_layout = QVBoxLayout(self.plane_controls_widget)
-        plane_layout.setContentsMargins(0, 0, 0, 0)
-
-        x_extent_row = QHBoxLayout()
-        x_extent_row.addWidget(QLabel("X Extent:"))
-        self.nf_x_extent_spin = QDoubleSpinBox()
-        self.nf_x_extent_spin.setRange(0.01, 10.0)
-        self.nf_x_extent_spin.setValue(0.5)
-        self.nf_x_extent_spin.setSuffix(" m")
-        self.nf_x_extent_spin.setDecimals(3)
-        x_extent_row.addWidget(self.nf_x_extent_spin)
-        x_extent_row.addStretch()
-        plane_layout.addLayout(x_extent_row)
-
-        y_extent_row = QHBoxLayout()
-        y_extent_row.addWidget(QLabel("Y Extent:"))
-        self.nf_y_extent_spin = QDoubleSpinBox()
-        self.nf_y_extent_spin.setRange(0.01, 10.0)
-        self.nf_y_extent_spin.setValue(0.5)
-        self.nf_y_extent_spin.setSuffix(" m")
-        self.nf_y_extent_spin.setDecimals(3)
-        y_extent_row.addWidget(self.nf_y_extent_spin)
-        y_extent_row.addStretch()
-        plane_layout.addLayout(y_extent_row)
-
-        z_dist_row = QHBoxLayout()
-        z_dist_row.addWidget(QLabel("Z Distance:"))
-        self.nf_z_distance_spin = QDoubleSpinBox()
-        self.nf_z_distance_spin.setRange(0.001, 10.0)
-        self.nf_z_distance_spin.setValue(0.1)
-        self.nf_z_distance_spin.setSuffix(" m")
-        self.nf_z_distance_spin.setDecimals(4)
-        z_dist_row.addWidget(self.nf_z_distance_spin)
-        z_dist_row.addStretch()
-        plane_layout.addLayout(z_dist_row)
-
-        x_pts_row = QHBoxLayout()
-        x_pts_row.addWidget(QLabel("X Points:"))
-        self.nf_x_points_spin = QSpinBox()
-        self.nf_x_points_spin.setRange(10, 501)
-        self.nf_x_points_spin.setValue(51)
-        x_pts_row.addWidget(self.nf_x_points_spin)
-        x_pts_row.addStretch()
-        plane_layout.addLayout(x_pts_row)
-
-        y_pts_row = QHBoxLayout()
-        y_pts_row.addWidget(QLabel("Y Points:"))
-        self.nf_y_points_spin = QSpinBox()
-        self.nf_y_points_spin.setRange(10, 501)
-        self.nf_y_points_spin.setValue(51)
-        y_pts_row.addWidget(self.nf_y_points_spin)
-        y_pts_row.addStretch()
-        plane_layout.addLayout(y_pts_row)
-
-        nf_layout.addWidget(self.plane_controls_widget)
-
-        # Initially hide plane controls
-        self.plane_controls_widget.setVisible(False)
+        # Planar surface controls are built lazily on the first switch
+        # to "Planar Surface"; most sessions never leave the sphere
+        self.plane_controls_widget = None
+        self._nf_layout = nf_layout
 
         # Calculate button
         self.calculate_nf_btn = QPushButton("Calculate Near Field")
@@ -246,7 +220,7 @@ class AnalysisPanel(QWidget):
         nf_layout.addWidget(self.calculate_nf_btn)
 
         # Results display
-        self.nf_results = QTextEdit()
+        self.nf_results = QPlainTextEdit()
         self.nf_results.setReadOnly(True)
         self.nf_results.setMaximumHeight(120)
         self.nf_results.setPlaceholderText("Near field results will appear here...")
@@ -274,14 +248,23 @@ class AnalysisPanel(QWidget):
 
     def on_pattern_loaded(self, pattern):
         """Handle pattern loaded event."""
+        self._release_nf_memmaps()
+        self._nf_cache.clear()
+        self._phasor_cache.clear()
+        self._last_swe_freq = None
+        # A power plot deferred while hidden belongs to the old pattern
+        self._pending_plot = None
+
         if pattern is None:
             self.current_pattern = None
+            self._has_swe = False
             self.swe_calculated = False
             self.nearfield_data = None
             self.swe_freq_combo.clear()
             self.swe_results.clear()
             self.nf_results.clear()
-            self.power_canvas.setVisible(False)
+            if self.power_canvas is not None:
+                self.power_canvas.setVisible(False)
             self.calculate_swe_btn.setEnabled(False)
             self.calculate_nf_btn.setEnabled(False)
             return
@@ -289,13 +272,21 @@ class AnalysisPanel(QWidget):
         self.current_pattern = pattern
         self.nearfield_data = None
 
-        # Update frequency combo for SWE
+        # Cache the attribute check once per load; hasattr is not free
+        # and this path runs on every file open
+        self._has_swe = bool(getattr(pattern, 'swe', None))
+
+        # Update frequency combo for SWE in one model reset instead of
+        # one signal emission per frequency
+        self.swe_freq_combo.blockSignals(True)
         self.swe_freq_combo.clear()
-        for freq in pattern.frequencies:
-            self.swe_freq_combo.addItem(f"{freq/1e6:.2f} MHz")
+        freqs_mhz = np.asarray(pattern.frequencies, dtype=np.float64) / 1e6
+        self.swe_freq_combo.addItems(
+            [f"{f:.2f} MHz" for f in freqs_mhz.tolist()])
+        self.swe_freq_combo.blockSignals(False)
 
         # Check if pattern has loaded SWE data
-        if hasattr(pattern, 'swe') and pattern.swe:
+        if self._has_swe:
             self.swe_calculated = True
             self._display_loaded_swe_data()
             self.calculate_nf_btn.setEnabled(True)
@@ -308,11 +299,110 @@ class AnalysisPanel(QWidget):
 
         self.nf_results.clear()
 
+    def _release_nf_memmaps(self):
+        """Unlink the temp files backing any memmapped near-field data."""
+        seen = set()
+        for nf_data in self._nf_cache.values():
+            self._unlink_memmaps(nf_data, seen)
+        if self.nearfield_data is not None:
+            self._unlink_memmaps(self.nearfield_data, seen)
+
+    @staticmethod
+    def _unlink_memmaps(nf_data, skip):
+        """Unlink one entry's memmap files, skipping (and recording) paths in skip."""
+        for path in nf_data.get('memmap_files', ()):
+            if path in skip:
+                continue
+            skip.add(path)
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _drop_nf_cache(self):
+        """Clear the near-field cache, unlinking entries' memmap files.
+
+        Files still backing the currently displayed data are kept.
+        """
+        live = set()
+        if self.nearfield_data is not None:
+            live.update(self.nearfield_data.get('memmap_files', ()))
+        for nf_data in self._nf_cache.values():
+            self._unlink_memmaps(nf_data, live)
+        self._nf_cache.clear()
+
+    def _ensure_plane_controls(self):
+        """Build the planar surface controls on first use."""
+        if self.plane_controls_widget is not None:
+            return
+
+        self.plane_controls_widget = QWidget()
+        plane_layout = QVBoxLayout(self.plane_controls_widget)
+        plane_layout.setContentsMargins(0, 0, 0, 0)
+
+        x_extent_row = QHBoxLayout()
+        x_extent_row.addWidget(QLabel("X Extent:"))
+        self.nf_x_extent_spin = QDoubleSpinBox()
+        self.nf_x_extent_spin.setRange(0.01, 10.0)
+        self.nf_x_extent_spin.setValue(0.5)
+        self.nf_x_extent_spin.setSuffix(" m")
+        self.nf_x_extent_spin.setDecimals(3)
+        x_extent_row.addWidget(self.nf_x_extent_spin)
+        x_extent_row.addStretch()
+        plane_layout.addLayout(x_extent_row)
+
+        y_extent_row = QHBoxLayout()
+        y_extent_row.addWidget(QLabel("Y Extent:"))
+        self.nf_y_extent_spin = QDoubleSpinBox()
+        self.nf_y_extent_spin.setRange(0.01, 10.0)
+        self.nf_y_extent_spin.setValue(0.5)
+        self.nf_y_extent_spin.setSuffix(" m")
+        self.nf_y_extent_spin.setDecimals(3)
+        y_extent_row.addWidget(self.nf_y_extent_spin)
+        y_extent_row.addStretch()
+        plane_layout.addLayout(y_extent_row)
+
+        z_dist_row = QHBoxLayout()
+        z_dist_row.addWidget(QLabel("Z Distance:"))
+        self.nf_z_distance_spin = QDoubleSpinBox()
+        self.nf_z_distance_spin.setRange(0.001, 10.0)
+        self.nf_z_distance_spin.setValue(0.1)
+        self.nf_z_distance_spin.setSuffix(" m")
+        self.nf_z_distance_spin.setDecimals(4)
+        z_dist_row.addWidget(self.nf_z_distance_spin)
+        z_dist_row.addStretch()
+        plane_layout.addLayout(z_dist_row)
+
+        x_pts_row = QHBoxLayout()
+        x_pts_row.addWidget(QLabel("X Points:"))
+        self.nf_x_points_spin = QSpinBox()
+        self.nf_x_points_spin.setRange(10, 501)
+        self.nf_x_points_spin.setValue(51)
+        x_pts_row.addWidget(self.nf_x_points_spin)
+        x_pts_row.addStretch()
+        plane_layout.addLayout(x_pts_row)
+
+        y_pts_row = QHBoxLayout()
+        y_pts_row.addWidget(QLabel("Y Points:"))
+        self.nf_y_points_spin = QSpinBox()
+        self.nf_y_points_spin.setRange(10, 501)
+        self.nf_y_points_spin.setValue(51)
+        y_pts_row.addWidget(self.nf_y_points_spin)
+        y_pts_row.addStretch()
+        plane_layout.addLayout(y_pts_row)
+
+        # Insert directly below the sphere controls
+        index = self._nf_layout.indexOf(self.sphere_controls_widget) + 1
+        self._nf_layout.insertWidget(index, self.plane_controls_widget)
+
     def on_surface_type_changed(self, surface_type):
         """Handle surface type change."""
         is_spherical = "Spherical" in surface_type
+        if not is_spherical:
+            self._ensure_plane_controls()
         self.sphere_controls_widget.setVisible(is_spherical)
-        self.plane_controls_widget.setVisible(not is_spherical)
+        if self.plane_controls_widget is not None:
+            self.plane_controls_widget.setVisible(not is_spherical)
 
     def on_calculate_swe(self):
         """Handle SWE calculation request."""
@@ -320,7 +410,7 @@ class AnalysisPanel(QWidget):
             return
 
         # Prevent multiple simultaneous calculations
-        if self.swe_worker is not None and self.swe_worker.isRunning():
+        if self._swe_busy:
             return
 
         try:
@@ -339,30 +429,43 @@ class AnalysisPanel(QWidget):
             self.calculate_swe_btn.setEnabled(False)
             self.calculate_swe_btn.setText("Calculating...")
 
-            # Create and configure worker thread
+            # Create and configure the runnable
             self.swe_worker = SWEWorker(self.current_pattern, frequency,
                                         nmax=nmax, mmax=mmax)
 
             # Connect signals
-            self.swe_worker.finished.connect(self.on_swe_finished)
-            self.swe_worker.error.connect(self.on_swe_error)
-            self.swe_worker.progress.connect(self.on_swe_progress)
+            self.swe_worker.signals.finished.connect(self.on_swe_finished)
+            self.swe_worker.signals.error.connect(self.on_swe_error)
+            self.swe_worker.signals.progress.connect(self.on_swe_progress)
 
-            # Start the calculation in background
-            self.swe_worker.start()
+            # Run on the shared pool; warm threads are reused across
+            # calculations
+            self._swe_busy = True
+            self._thread_pool.start(self.swe_worker)
 
         except Exception as e:
-            self.swe_results.setText(f"Error: {str(e)}")
+            self._swe_busy = False
+            self.swe_results.setPlainText(f"Error: {str(e)}")
             self.calculate_swe_btn.setEnabled(True)
             self.calculate_swe_btn.setText("Calculate SWE Coefficients")
 
     def on_swe_finished(self, swe_obj):
         """Handle successful SWE calculation."""
+        self._swe_busy = False
+
         # Store SWE data in pattern
         pattern = self.current_pattern
-        if not hasattr(pattern, 'swe'):
+        if getattr(pattern, 'swe', None) is None:
             pattern.swe = {}
         pattern.swe[swe_obj.frequency] = swe_obj
+        self._has_swe = True
+        self._last_swe_freq = swe_obj.frequency
+
+        # Recalculated coefficients invalidate every cached near field.
+        # Dropping the cache also matters for correctness: the old SWE
+        # object freed by the rebind above can have its id() reused by
+        # a later calculation, which would match stale cache keys
+        self._drop_nf_cache()
 
         # Display results
         self.display_swe_results(swe_obj)
@@ -373,7 +476,8 @@ class AnalysisPanel(QWidget):
 
     def on_swe_error(self, error_msg):
         """Handle SWE calculation error."""
-        self.swe_results.setText(f"Error: {error_msg}")
+        self._swe_busy = False
+        self.swe_results.setPlainText(f"Error: {error_msg}")
         self.calculate_swe_btn.setEnabled(True)
         self.calculate_swe_btn.setText("Calculate SWE Coefficients")
 
@@ -386,206 +490,379 @@ class AnalysisPanel(QWidget):
         if self.current_pattern is None or not self.swe_calculated:
             return
 
+        # Prevent multiple simultaneous calculations
+        if self.nf_worker is not None and self.nf_worker.isRunning():
+            return
+
         try:
-            from swe import cartesian_to_spherical
+            from antenna_pattern_viewer.workers.nearfield_worker import NearFieldWorker
 
             surface_type = self.get_nf_surface_type()
 
             # Get the SWE object from the pattern
             pattern = self.current_pattern
 
-            # Get the SWE object for the first (or selected) frequency
-            freq = list(pattern.swe.keys())[0]
-            swe = pattern.swe[freq]
+            # Get the SWE object for the first (or selected) frequency,
+            # or all of them when the batched path is requested
+            if self.nf_all_freqs_check.isChecked() and len(pattern.swe) > 1:
+                swe = dict(pattern.swe)
+                swe_id = tuple(sorted((f, id(s)) for f, s in swe.items()))
+            else:
+                freq = self._last_swe_freq
+                if freq is None or freq not in pattern.swe:
+                    freq = next(iter(pattern.swe))
+                swe = pattern.swe[freq]
+                swe_id = id(swe)
 
             if surface_type == "spherical":
-                # Get spherical parameters
                 params = self.get_nf_sphere_params()
-
-                # Create theta and phi arrays (in degrees)
-                theta_deg = np.linspace(0, 180, params['theta_points'])
-                phi_deg = np.linspace(0, 360, params['phi_points'])
-
-                # Convert to radians
-                theta_rad = np.radians(theta_deg)
-                phi_rad = np.radians(phi_deg)
-
-                # Create meshgrid
-                THETA, PHI = np.meshgrid(theta_rad, phi_rad, indexing='ij')
-                R = np.full_like(THETA, params['radius'])
-
-                # Evaluate near field
-                (E_r, E_theta, E_phi), (H_r, H_theta, H_phi) = swe.near_field(
-                    R.ravel(), THETA.ravel(), PHI.ravel()
-                )
-
-                # Reshape to grid
-                shape = THETA.shape
-                nf_data = {
-                    'E_r': E_r.reshape(shape),
-                    'E_theta': E_theta.reshape(shape),
-                    'E_phi': E_phi.reshape(shape),
-                    'H_r': H_r.reshape(shape),
-                    'H_theta': H_theta.reshape(shape),
-                    'H_phi': H_phi.reshape(shape),
-                    'theta': theta_deg,
-                    'phi': phi_deg,
-                    'radius': params['radius'],
-                    'is_spherical': True
-                }
-
-            else:  # planar
-                # Get planar parameters
+            else:
                 params = self.get_nf_plane_params()
 
-                # Create x and y arrays
-                x = np.linspace(-params['x_extent'], params['x_extent'], params['x_points'])
-                y = np.linspace(-params['y_extent'], params['y_extent'], params['y_points'])
-
-                # Create meshgrid
-                X, Y = np.meshgrid(x, y, indexing='ij')
-                Z = np.full_like(X, params['z_distance'])
-
-                # Convert to spherical coordinates
-                r, theta, phi = cartesian_to_spherical(X.ravel(), Y.ravel(), Z.ravel())
-
-                # Evaluate near field in spherical coordinates
-                (E_r, E_theta, E_phi), (H_r, H_theta, H_phi) = swe.near_field(r, theta, phi)
-
-                # Reshape to grid
-                shape = X.shape
-                nf_data = {
-                    'E_r': E_r.reshape(shape),
-                    'E_theta': E_theta.reshape(shape),
-                    'E_phi': E_phi.reshape(shape),
-                    'H_r': H_r.reshape(shape),
-                    'H_theta': H_theta.reshape(shape),
-                    'H_phi': H_phi.reshape(shape),
-                    'x': x,
-                    'y': y,
-                    'x_extent': params['x_extent'],
-                    'y_extent': params['y_extent'],
-                    'z_distance': params['z_distance'],
-                    'is_spherical': False
-                }
-
-            # Store data
-            self.nearfield_data = nf_data
-
-            # Display results
-            self.display_nearfield_results(nf_data)
-
-            # Emit signal
-            self.nearfield_calculated.emit(nf_data)
+            # Re-clicking with identical parameters is common while iterating
+            # on plots; serve those from a small bounded cache
+            cache_key = (swe_id, surface_type, tuple(sorted(params.items())))
+            cached = self._nf_cache.get(cache_key)
+            if cached is not None:
+                # Hand out a shallow copy so consumers adding keys to
+                # the dict don't mutate the cached entry (the field
+                # arrays themselves are read-only and shared)
+                nf_data = dict(cached)
+                self._nf_cache.move_to_end(cache_key)
+                self.nearfield_data = nf_data
+                self.display_nearfield_results(nf_data)
+                self.nearfield_calculated.emit(nf_data)
+                return
+
+            # Update button state
+            self.calculate_nf_btn.setEnabled(False)
+            self.calculate_nf_btn.setText("Calculating...")
+            self._nf_pending_key = cache_key
+
+            # Create and configure worker thread
+            phi_phasor = None
+            if surface_type == "spherical" and not isinstance(swe, dict):
+                phi_phasor = self._get_phi_phasor(swe, params['phi_points'])
+            self.nf_worker = NearFieldWorker(swe, surface_type, params,
+                                             precision=self._precision,
+                                             phi_phasor=phi_phasor)
+
+            # Connect signals
+            self.nf_worker.finished.connect(self.on_nf_finished)
+            self.nf_worker.error.connect(self.on_nf_error)
+            self.nf_worker.progress.connect(self.on_nf_progress)
+
+            # Start the calculation in background
+            self.nf_worker.start()
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error: {str(e)}\n{traceback.format_exc()}"
-            self.nf_results.setText(error_msg)
-            logger.error(f"Near field calculation failed: {e}", exc_info=True)
+            # The full stack goes to the log; the panel only needs the
+            # one-line summary
+            logger.exception("Near field calculation failed")
+            self.nf_results.setPlainText(f"Error: {e}")
+            self.calculate_nf_btn.setEnabled(True)
+            self.calculate_nf_btn.setText("Calculate Near Field")
+
+    def _get_phi_phasor(self, swe, phi_points):
+        """Get the cached exp(i m phi) table for this MMAX / phi grid."""
+        mmax = getattr(swe, 'MMAX', None)
+        if mmax is None:
+            return None
+        key = (mmax, phi_points)
+        phasor = self._phasor_cache.get(key)
+        if phasor is None:
+            phi_rad = np.radians(np.linspace(0, 360, phi_points,
+                                             endpoint=False))
+            m = np.arange(-mmax, mmax + 1)
+            phasor = np.exp(1j * np.outer(m, phi_rad))
+            self._phasor_cache[key] = phasor
+        return phasor
+
+    def on_nf_progress(self, message):
+        """Show worker progress on the calculate button."""
+        self.calculate_nf_btn.setText(message)
+
+    def on_nf_finished(self, nf_data):
+        """Handle successful near field calculation."""
+        # Publish C-contiguous, read-only field arrays: subscribers
+        # share the buffers instead of silently copying them, and any
+        # accidental in-place write raises instead of corrupting the
+        # cached results
+        for k in ('E_r', 'E_theta', 'E_phi', 'H_r', 'H_theta', 'H_phi'):
+            a = np.ascontiguousarray(nf_data[k])
+            a.setflags(write=False)
+            nf_data[k] = a
+
+        # Store data and cache for repeat clicks (bounded to 8 entries,
+        # oldest first out); cache a shallow copy so later additions to
+        # the emitted dict don't leak into the cached entry
+        self.nearfield_data = nf_data
+        if self._nf_pending_key is not None:
+            self._nf_cache[self._nf_pending_key] = dict(nf_data)
+            # Evicted entries take their memmap files with them; only
+            # paths still backing the displayed data are kept
+            live = set(nf_data.get('memmap_files', ()))
+            while len(self._nf_cache) > 8:
+                _, evicted = self._nf_cache.popitem(last=False)
+                self._unlink_memmaps(evicted, live)
+            self._nf_pending_key = None
+
+        # Display results
+        self.display_nearfield_results(nf_data)
+
+        # Re-enable button
+        self.calculate_nf_btn.setEnabled(True)
+        self.calculate_nf_btn.setText("Calculate Near Field")
+
+        # Emit signal
+        self.nearfield_calculated.emit(nf_data)
+
+    def on_nf_error(self, error_msg):
+        """Handle near field calculation error."""
+        self.nf_results.setPlainText(f"Error: {error_msg}")
+        self.calculate_nf_btn.setEnabled(True)
+        self.calculate_nf_btn.setText("Calculate Near Field")
+        logger.error(f"Near field calculation failed: {error_msg}")
+
+    @staticmethod
+    def _swe_has_radius(swe):
+        """hasattr(swe, 'radius'), cached on the SWE object."""
+        has_radius = getattr(swe, '_has_radius', None)
+        if has_radius is None:
+            has_radius = swe._has_radius = hasattr(swe, 'radius')
+        return has_radius
+
+    @staticmethod
+    def _swe_as_arrays(swe):
+        """
+        Coefficients in struct-of-arrays layout, cached on the SWE
+        object: (n, m, q1, q2) aligned over the union of mode keys.
+        """
+        arrays = getattr(swe, '_cached_arrays', None)
+        if arrays is None:
+            # dict views union directly; no intermediate set copies
+            keys = list(swe.Q1_coeffs.keys() | swe.Q2_coeffs.keys())
+            count = len(keys)
+            n = np.fromiter((k[0] for k in keys), dtype=np.int64, count=count)
+            m = np.fromiter((k[1] for k in keys), dtype=np.int64, count=count)
+            q1 = np.fromiter((swe.Q1_coeffs.get(k, 0j) for k in keys),
+                             dtype=np.complex128, count=count)
+            q2 = np.fromiter((swe.Q2_coeffs.get(k, 0j) for k in keys),
+                             dtype=np.complex128, count=count)
+            arrays = swe._cached_arrays = (n, m, q1, q2)
+        return arrays
+
+    def _total_power(self, swe):
+        """Total radiated power from the Q coefficients, vectorized."""
+        _, _, q1, q2 = self._swe_as_arrays(swe)
+        return float(np.vdot(q1, q1).real + np.vdot(q2, q2).real)
 
     def display_swe_results(self, swe):
         """Display SWE calculation results with power-per-mode analysis."""
         self.swe_calculated = True
         self.calculate_nf_btn.setEnabled(True)
 
-        result_text = "SWE Coefficients calculated:\n"
-        result_text += f"Frequency: {swe.frequency/1e9:.3f} GHz\n"
-        result_text += f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}\n"
+        lines = ["SWE Coefficients calculated:",
+                 f"Frequency: {swe.frequency/1e9:.3f} GHz",
+                 f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}"]
 
         # Calculate total modes
         total_modes = len(swe.Q1_coeffs) + len(swe.Q2_coeffs)
-        result_text += f"Total coefficients: {total_modes}\n"
+        lines.append(f"Total coefficients: {total_modes}")
 
         # Calculate total power
-        total_power = sum(abs(q)**2 for q in swe.Q1_coeffs.values())
-        total_power += sum(abs(q)**2 for q in swe.Q2_coeffs.values())
-        result_text += f"Total power: {total_power:.6e} W\n"
+        total_power = self._total_power(swe)
+        lines.append(f"Total power: {total_power:.6e} W")
+
+        self.swe_results.setPlainText("\n".join(lines))
 
-        self.swe_results.setText(result_text)
+        # Freshly calculated coefficients: drop any cached plot arrays
+        swe._cum_power_cache = None
 
         # Compute and plot power distributions
-        power_per_n, power_per_m = self._compute_power_distributions(swe)
-        self._plot_power_distributions(power_per_n, power_per_m)
+        self._plot_power_distributions(swe)
 
     def _compute_power_distributions(self, swe):
-        """Compute power aggregated by n and by |m|."""
-        all_modes = set(swe.Q1_coeffs.keys()) | set(swe.Q2_coeffs.keys())
-
-        power_per_n = {}
-        power_per_m = {}
-        for (n, m) in all_modes:
-            q1 = swe.Q1_coeffs.get((n, m), 0)
-            q2 = swe.Q2_coeffs.get((n, m), 0)
-            mode_power = abs(q1)**2 + abs(q2)**2
-            power_per_n[n] = power_per_n.get(n, 0) + mode_power
-            power_per_m[abs(m)] = power_per_m.get(abs(m), 0) + mode_power
+        """
+        Compute power aggregated by n and by |m|.
+
+        Returns dense arrays indexed by n and |m| (np.bincount layout).
+        """
+        n_arr, m_arr, q1, q2 = self._swe_as_arrays(swe)
+
+        # |q1|^2 + |q2|^2 without the sqrt that abs() would take
+        power = (q1.real * q1.real + q1.imag * q1.imag
+                 + q2.real * q2.real + q2.imag * q2.imag)
+
+        power_per_n = np.bincount(n_arr, weights=power,
+                                  minlength=int(swe.NMAX) + 1)
+        power_per_m = np.bincount(np.abs(m_arr), weights=power,
+                                  minlength=int(swe.MMAX) + 1)
 
         return power_per_n, power_per_m
 
-    def _plot_power_distributions(self, power_per_n, power_per_m):
-        """Plot cumulative power vs n and power per |m|."""
-        self.power_figure.clear()
+    def _power_plot_arrays(self, swe):
+        """
+        Derived plot arrays (n, cumulative %, |m|, dB), cached on the
+        SWE object so repeated redraws skip the cumsum/log10 work.
+        """
+        cache = getattr(swe, '_cum_power_cache', None)
+        if cache is not None:
+            return cache
+
+        power_per_n, power_per_m = self._compute_power_distributions(swe)
 
-        # Top subplot: Cumulative power vs n
-        ax1 = self.power_figure.add_subplot(2, 1, 1)
-        n_values = sorted(power_per_n.keys())
-        powers_n = np.array([power_per_n[n] for n in n_values])
+        # Plot only modes that actually carry power; the bincount
+        # arrays are dense over 0..NMAX / 0..MMAX
+        powers_n = power_per_n
         total_power = powers_n.sum()
+        n_values = np.nonzero(powers_n)[0]
+        if n_values.size == 0:
+            n_values = np.arange(powers_n.size)
         if total_power > 0:
-            cumulative = np.cumsum(powers_n) / total_power * 100.0
+            cumulative = (np.cumsum(powers_n) / total_power * 100.0)[n_values]
         else:
-            cumulative = np.zeros_like(powers_n)
-
-        ax1.plot(n_values, cumulative, 'b-', linewidth=1.5)
-        ax1.axhline(y=99.9, color='r', linestyle='--', alpha=0.7, label='99.9%')
-        ax1.set_xlabel('Mode order n')
-        ax1.set_ylabel('Cumulative power (%)')
-        ax1.set_title('Power convergence', fontsize=9)
-        ax1.legend(fontsize=7)
-        ax1.grid(True, alpha=0.3)
-        if len(cumulative) > 0:
-            ax1.set_ylim([max(0, cumulative[0] - 5), 100.5])
+            cumulative = np.zeros(n_values.size)
 
-        # Bottom subplot: Power per |m|
-        ax2 = self.power_figure.add_subplot(2, 1, 2)
-        m_values = sorted(power_per_m.keys())
-        powers_m = np.array([power_per_m[m] for m in m_values])
+        powers_m = power_per_m
+        m_values = np.nonzero(powers_m)[0]
+        if m_values.size == 0:
+            m_values = np.arange(powers_m.size)
         if total_power > 0:
-            powers_m_db = 10 * np.log10(np.maximum(powers_m / total_power, 1e-15))
+            powers_m_db = 10 * np.log10(
+                np.maximum(powers_m[m_values] / total_power, 1e-15))
         else:
-            powers_m_db = np.full_like(powers_m, -150.0)
+            powers_m_db = np.full(m_values.size, -150.0)
+
+        cache = (n_values, cumulative, m_values, powers_m_db)
+        swe._cum_power_cache = cache
+        return cache
 
-        ax2.bar(m_values, powers_m_db, color='steelblue', alpha=0.8)
-        ax2.set_xlabel('Azimuthal index |m|')
-        ax2.set_ylabel('Relative power (dB)')
-        ax2.set_title('Power per azimuthal mode', fontsize=9)
-        ax2.grid(True, alpha=0.3, axis='y')
+    def _plot_power_distributions(self, swe):
+        """
+        Plot cumulative power vs n and power per |m| for this SWE.
+
+        While the panel is hidden the plot is deferred until showEvent,
+        so pattern loads don't pay for a matplotlib draw nobody sees.
+        """
+        if not self.isVisible():
+            self._pending_plot = swe
+            return
+        self._pending_plot = None
+        self._do_plot_power_distributions(swe)
+
+    def showEvent(self, event):
+        """Draw any power plot that was deferred while hidden."""
+        super().showEvent(event)
+        if self._pending_plot is not None:
+            pending, self._pending_plot = self._pending_plot, None
+            self._do_plot_power_distributions(pending)
+
+    def _do_plot_power_distributions(self, swe):
+        """Render the power distributions for this SWE object."""
+        self._ensure_power_canvas()
+
+        n_values, cumulative, m_values, powers_m_db = \
+            self._power_plot_arrays(swe)
+
+        # Top subplot: Cumulative power vs n. After the first draw the
+        # existing Line2D artist is updated in place, which skips the
+        # full axes teardown/relayout a clear-and-replot triggers
+        ax1 = self._power_ax1
+        if self._power_line is None:
+            self._power_line, = ax1.plot(n_values, cumulative, 'b-',
+                                         linewidth=1.5)
+            ax1.axhline(y=99.9, color='r', linestyle='--', alpha=0.7,
+                        label='99.9%')
+            ax1.set_xlabel('Mode order n')
+            ax1.set_ylabel('Cumulative power (%)')
+            ax1.set_title('Power convergence', fontsize=9)
+            ax1.legend(fontsize=7)
+            ax1.grid(True, alpha=0.3)
+        else:
+            self._power_line.set_data(n_values, cumulative)
+            ax1.relim()
+            ax1.autoscale_view()
+        if len(cumulative) > 0:
+            ax1.set_ylim([max(0, cumulative[0] - 5), 100.5])
+
+        # Bottom subplot: Power per |m|. Bars can only be reused while
+        # the mode count is unchanged; otherwise rebuild them
+        ax2 = self._power_ax2
+        if self._power_bars is not None and not np.array_equal(
+                self._power_bars_x, m_values):
+            ax2.clear()
+            self._power_bars = None
+        if self._power_bars is None:
+            self._power_bars = ax2.bar(m_values, powers_m_db,
+                                       color='steelblue', alpha=0.8)
+            self._power_bars_x = m_values
+            ax2.set_xlabel('Azimuthal index |m|')
+            ax2.set_ylabel('Relative power (dB)')
+            ax2.set_title('Power per azimuthal mode', fontsize=9)
+            ax2.grid(True, alpha=0.3, axis='y')
+        else:
+            for rect, height in zip(self._power_bars, powers_m_db):
+                rect.set_height(height)
+            ax2.relim()
+            ax2.autoscale_view()
 
         self.power_figure.tight_layout()
         self.power_canvas.setVisible(True)
-        self.power_canvas.draw()
+        self._redraw_timer.start()
+
+    def _ensure_power_canvas(self):
+        """Create the power-per-mode figure and canvas on first use."""
+        if self.power_canvas is not None:
+            return
+
+        from matplotlib.backends.backend_qtagg import (
+            FigureCanvasQTAgg as FigureCanvas)
+        from matplotlib.figure import Figure
+
+        self.power_figure = Figure(figsize=(4, 3))
+        self.power_canvas = FigureCanvas(self.power_figure)
+        self.power_canvas.setMinimumHeight(280)
+        self.power_canvas.setVisible(False)
+
+        # Persistent axes and artists; updates mutate these in place
+        # instead of rebuilding the whole figure each time
+        self._power_ax1 = self.power_figure.add_subplot(2, 1, 1)
+        self._power_ax2 = self.power_figure.add_subplot(2, 1, 2)
+        self._power_line = None
+        self._power_bars = None
+        self._power_bars_x = None
+
+        # Coalesce rapid replot requests into one draw per interval
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(50)
+        self._redraw_timer.timeout.connect(self.power_canvas.draw_idle)
+
+        # Insert directly below the SWE results display
+        index = self._swe_layout.indexOf(self.swe_results) + 1
+        self._swe_layout.insertWidget(index, self.power_canvas)
 
     def display_nearfield_results(self, nf_data):
         """Display near field calculation results."""
         surface_type = "spherical" if nf_data.get('is_spherical', True) else "planar"
-        result_text = f"Near Field Calculated ({surface_type}):\n"
+        lines = [f"Near Field Calculated ({surface_type}):"]
 
         if surface_type == "spherical":
-            result_text += f"Radius: {nf_data['radius']:.4f} m\n"
-            result_text += f"Theta points: {len(nf_data['theta'])}\n"
-            result_text += f"Phi points: {len(nf_data['phi'])}\n"
+            lines.append(f"Radius: {nf_data['radius']:.4f} m")
+            lines.append(f"Theta points: {len(nf_data['theta'])}")
+            lines.append(f"Phi points: {len(nf_data['phi'])}")
         else:
-            result_text += f"X extent: +/-{nf_data['x_extent']:.3f} m\n"
-            result_text += f"Y extent: +/-{nf_data['y_extent']:.3f} m\n"
-            result_text += f"Z distance: {nf_data['z_distance']:.4f} m\n"
-            result_text += f"Grid: {len(nf_data['x'])} x {len(nf_data['y'])} points\n"
+            lines.append(f"X extent: +/-{nf_data['x_extent']:.3f} m")
+            lines.append(f"Y extent: +/-{nf_data['y_extent']:.3f} m")
+            lines.append(f"Z distance: {nf_data['z_distance']:.4f} m")
+            lines.append(f"Grid: {len(nf_data['x'])} x {len(nf_data['y'])} points")
 
-        self.nf_results.setText(result_text)
+        self.nf_results.setPlainText("\n".join(lines))
 
     def _display_loaded_swe_data(self):
         """Display SWE data that was loaded from file."""
-        if not hasattr(self.current_pattern, 'swe') or not self.current_pattern.swe:
+        if not self._has_swe:
             return
 
         num_frequencies = len(self.current_pattern.swe)
@@ -597,47 +874,49 @@ class AnalysisPanel(QWidget):
             swe = self.current_pattern.swe[freq]
             swe_for_plot = swe
 
-            result_text = "SWE Coefficients (loaded from file):\n"
-            result_text += f"Frequency: {swe.frequency/1e9:.3f} GHz\n"
+            lines = ["SWE Coefficients (loaded from file):",
+                     f"Frequency: {swe.frequency/1e9:.3f} GHz"]
 
             # Calculate wavelength
             wavelength = 299792458.0 / swe.frequency if swe.frequency else 0
-            if hasattr(swe, 'radius'):
-                result_text += f"Radius: {swe.radius:.4f} m ({swe.radius/wavelength:.2f} lambda)\n"
+            if self._swe_has_radius(swe):
+                lines.append(f"Radius: {swe.radius:.4f} m ({swe.radius/wavelength:.2f} lambda)")
 
-            result_text += f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}\n"
+            lines.append(f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}")
 
             # Calculate total modes
             total_modes = len(swe.Q1_coeffs) + len(swe.Q2_coeffs)
-            result_text += f"Total coefficients: {total_modes}\n"
+            lines.append(f"Total coefficients: {total_modes}")
 
             # Calculate total power if possible
-            total_power = sum(abs(q)**2 for q in swe.Q1_coeffs.values())
-            total_power += sum(abs(q)**2 for q in swe.Q2_coeffs.values())
-            result_text += f"Total power: {total_power:.6e} W\n"
+            total_power = self._total_power(swe)
+            lines.append(f"Total power: {total_power:.6e} W")
 
         else:
             # Multiple frequencies - display summary, use first for plot
             swe_for_plot = list(self.current_pattern.swe.values())[0]
 
-            result_text = f"SWE Coefficients (loaded from file):\n"
-            result_text += f"{num_frequencies} frequencies with SWE data:\n\n"
+            lines = ["SWE Coefficients (loaded from file):",
+                     f"{num_frequencies} frequencies with SWE data:", ""]
+
+            # One vectorized division instead of one per loop iteration
+            swes = list(self.current_pattern.swe.values())
+            wavelengths = 299792458.0 / np.array(
+                [swe.frequency for swe in swes], dtype=np.float64)
 
-            for freq, swe in self.current_pattern.swe.items():
-                result_text += f"  - {swe.frequency/1e9:.3f} GHz: "
-                result_text += f"MMAX={swe.MMAX}, NMAX={swe.NMAX}"
+            for swe, wavelength in zip(swes, wavelengths):
+                line = (f"  - {swe.frequency/1e9:.3f} GHz: "
+                        f"MMAX={swe.MMAX}, NMAX={swe.NMAX}")
 
-                if hasattr(swe, 'radius'):
-                    wavelength = 299792458.0 / swe.frequency
-                    result_text += f", R={swe.radius:.4f} m ({swe.radius/wavelength:.2f} lambda)"
-                result_text += "\n"
+                if self._swe_has_radius(swe):
+                    line += f", R={swe.radius:.4f} m ({swe.radius/wavelength:.2f} lambda)"
+                lines.append(line)
 
-        self.swe_results.setText(result_text)
+        self.swe_results.setPlainText("\n".join(lines))
 
         # Plot power distributions
         if swe_for_plot is not None:
-            power_per_n, power_per_m = self._compute_power_distributions(swe_for_plot)
-            self._plot_power_distributions(power_per_n, power_per_m)
+            self._plot_power_distributions(swe_for_plot)
 
     # Getter methods
     def get_swe_frequency(self):
@@ -662,6 +941,7 @@ class AnalysisPanel(QWidget):
 
     def get_nf_plane_params(self):
         """Get planar surface parameters."""
+        self._ensure_plane_controls()
         return {
             'x_extent': self.nf_x_extent_spin.value(),
             'y_extent': self.nf_y_extent_spin.value(),
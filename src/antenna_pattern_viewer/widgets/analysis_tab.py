@@ -11,6 +11,9 @@ from .collapsible_group import CollapsibleGroupBox
 
 import numpy as np
 
+# Speed of light in m/s, for wavelength annotations
+_SPEED_OF_LIGHT = 299792458.0
+
 
 class AnalysisTab(QWidget):
     """Tab containing analysis and computation controls."""
@@ -24,6 +27,9 @@ class AnalysisTab(QWidget):
         self.current_pattern = None
         self.swe_calculated = False
         self.nearfield_data = None
+        # Rendered SWE summary text keyed by id(pattern.swe); the text
+        # only changes when the SWE data itself does
+        self._swe_text_cache = {}
         self.setup_ui()
     
     def setup_ui(self):
@@ -62,11 +68,33 @@ class AnalysisTab(QWidget):
         
         layout.addWidget(swe_group)
         
-        # Near Field Evaluation section
-        nf_group = CollapsibleGroupBox("Near Field Evaluation")
+        # Near Field Evaluation section; the group starts collapsed, so
+        # its controls are built on first expansion
+        self._nf_calc_enabled = False
+        self.nf_group = CollapsibleGroupBox(
+            "Near Field Evaluation", content_builder=self._build_nf_group)
+
+        layout.addWidget(self.nf_group)
         
-        nf_group.addWidget(QLabel("Evaluate near field from SWE coefficients:"))
+        # Add stretch
+        layout.addStretch()
+        
+        # Set scroll widget
+        scroll_area.setWidget(scroll_widget)
         
+        # Main layout
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(scroll_area)
+        self.setLayout(main_layout)
+        
+        # Expand SWE by default
+        swe_group.toggle_collapsed()
+    
+    def _build_nf_group(self, nf_group):
+        """Build the near field group contents (deferred to first expand)."""
+        nf_group.addWidget(QLabel("Evaluate near field from SWE coefficients:"))
+
         # Surface type selection
         surface_layout = QHBoxLayout()
         surface_layout.addWidget(QLabel("Surface Type:"))
@@ -75,12 +103,12 @@ class AnalysisTab(QWidget):
         self.nf_surface_combo.currentTextChanged.connect(self.on_surface_type_changed)
         surface_layout.addWidget(self.nf_surface_combo)
         nf_group.addLayout(surface_layout)
-        
+
         # Spherical surface controls
         self.sphere_controls_widget = QWidget()
         sphere_layout = QVBoxLayout(self.sphere_controls_widget)
         sphere_layout.setContentsMargins(0, 0, 0, 0)
-        
+
         radius_layout = QHBoxLayout()
         radius_layout.addWidget(QLabel("Radius:"))
         self.nf_sphere_radius_spin = QDoubleSpinBox()
@@ -90,7 +118,7 @@ class AnalysisTab(QWidget):
         self.nf_sphere_radius_spin.setDecimals(4)
         radius_layout.addWidget(self.nf_sphere_radius_spin)
         sphere_layout.addLayout(radius_layout)
-        
+
         theta_pts_layout = QHBoxLayout()
         theta_pts_layout.addWidget(QLabel("Theta Points:"))
         self.nf_theta_points_spin = QSpinBox()
@@ -98,7 +126,7 @@ class AnalysisTab(QWidget):
         self.nf_theta_points_spin.setValue(91)
         theta_pts_layout.addWidget(self.nf_theta_points_spin)
         sphere_layout.addLayout(theta_pts_layout)
-        
+
         phi_pts_layout = QHBoxLayout()
         phi_pts_layout.addWidget(QLabel("Phi Points:"))
         self.nf_phi_points_spin = QSpinBox()
@@ -106,14 +134,35 @@ class AnalysisTab(QWidget):
         self.nf_phi_points_spin.setValue(91)
         phi_pts_layout.addWidget(self.nf_phi_points_spin)
         sphere_layout.addLayout(phi_pts_layout)
-        
+
         nf_group.addWidget(self.sphere_controls_widget)
-        
-        # Planar surface controls
+
+        # Planar surface controls are built lazily on the first switch
+        # to "Planar Surface"
+        self.plane_controls_widget = None
+
+        # Calculate button
+        self.calculate_nf_btn = QPushButton("Calculate Near Field")
+        self.calculate_nf_btn.clicked.connect(self.on_calculate_nearfield)
+        self.calculate_nf_btn.setEnabled(self._nf_calc_enabled)
+        nf_group.addWidget(self.calculate_nf_btn)
+
+        # Results display
+        self.nf_results = QTextEdit()
+        self.nf_results.setReadOnly(True)
+        self.nf_results.setMaximumHeight(80)
+        self.nf_results.setPlaceholderText("Near field results will appear here...")
+        nf_group.addWidget(self.nf_results)
+
+    def _ensure_plane_controls(self):
+        """Build the planar surface controls on first use."""
+        if self.plane_controls_widget is not None:
+            return
+
         self.plane_controls_widget = QWidget()
         plane_layout = QVBoxLayout(self.plane_controls_widget)
         plane_layout.setContentsMargins(0, 0, 0, 0)
-        
+
         x_extent_layout = QHBoxLayout()
         x_extent_layout.addWidget(QLabel("X Extent:"))
         self.nf_x_extent_spin = QDoubleSpinBox()
@@ -123,7 +172,7 @@ class AnalysisTab(QWidget):
         self.nf_x_extent_spin.setDecimals(3)
         x_extent_layout.addWidget(self.nf_x_extent_spin)
         plane_layout.addLayout(x_extent_layout)
-        
+
         y_extent_layout = QHBoxLayout()
         y_extent_layout.addWidget(QLabel("Y Extent:"))
         self.nf_y_extent_spin = QDoubleSpinBox()
@@ -133,7 +182,7 @@ class AnalysisTab(QWidget):
         self.nf_y_extent_spin.setDecimals(3)
         y_extent_layout.addWidget(self.nf_y_extent_spin)
         plane_layout.addLayout(y_extent_layout)
-        
+
         z_dist_layout = QHBoxLayout()
         z_dist_layout.addWidget(QLabel("Z Distance:"))
         self.nf_z_distance_spin = QDoubleSpinBox()
@@ -143,7 +192,7 @@ class AnalysisTab(QWidget):
         self.nf_z_distance_spin.setDecimals(4)
         z_dist_layout.addWidget(self.nf_z_distance_spin)
         plane_layout.addLayout(z_dist_layout)
-        
+
         x_pts_layout = QHBoxLayout()
         x_pts_layout.addWidget(QLabel("X Points:"))
         self.nf_x_points_spin = QSpinBox()
@@ -151,7 +200,7 @@ class AnalysisTab(QWidget):
         self.nf_x_points_spin.setValue(51)
         x_pts_layout.addWidget(self.nf_x_points_spin)
         plane_layout.addLayout(x_pts_layout)
-        
+
         y_pts_layout = QHBoxLayout()
         y_pts_layout.addWidget(QLabel("Y Points:"))
         self.nf_y_points_spin = QSpinBox()
@@ -159,76 +208,59 @@ class AnalysisTab(QWidget):
         self.nf_y_points_spin.setValue(51)
         y_pts_layout.addWidget(self.nf_y_points_spin)
         plane_layout.addLayout(y_pts_layout)
-        
-        nf_group.addWidget(self.plane_controls_widget)
-        
-        # Initially hide plane controls
-        self.plane_controls_widget.setVisible(False)
-        
-        # Calculate button
-        self.calculate_nf_btn = QPushButton("Calculate Near Field")
-        self.calculate_nf_btn.clicked.connect(self.on_calculate_nearfield)
-        self.calculate_nf_btn.setEnabled(False)
-        nf_group.addWidget(self.calculate_nf_btn)
 
-        # Results display
-        self.nf_results = QTextEdit()
-        self.nf_results.setReadOnly(True)
-        self.nf_results.setMaximumHeight(80)
-        self.nf_results.setPlaceholderText("Near field results will appear here...")
-        nf_group.addWidget(self.nf_results)
-        
-        layout.addWidget(nf_group)
-        
-        # Add stretch
-        layout.addStretch()
-        
-        # Set scroll widget
-        scroll_area.setWidget(scroll_widget)
-        
-        # Main layout
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(scroll_area)
-        self.setLayout(main_layout)
-        
-        # Expand SWE by default
-        swe_group.toggle_collapsed()
-    
+        # Insert directly below the sphere controls
+        content = self.nf_group.content_layout
+        index = content.indexOf(self.sphere_controls_widget) + 1
+        content.insertWidget(index, self.plane_controls_widget)
+
+    def _set_nf_enabled(self, enabled):
+        """Enable/disable near field calculation, tolerating lazy build."""
+        self._nf_calc_enabled = enabled
+        if self.nf_group.is_built():
+            self.calculate_nf_btn.setEnabled(enabled)
+
     def update_pattern(self, pattern):
         """Update controls with new pattern."""
+        if pattern is not self.current_pattern:
+            self._swe_text_cache.clear()
         self.current_pattern = pattern
         self.nearfield_data = None
         
-        # Update frequency combo for SWE
+        # Update frequency combo for SWE with one model reset instead
+        # of one signal emission per frequency
+        freqs_mhz = np.asarray(pattern.frequencies, dtype=np.float64) / 1e6
+        labels = [f"{f:.2f} MHz" for f in freqs_mhz.tolist()]
+        self.swe_freq_combo.blockSignals(True)
         self.swe_freq_combo.clear()
-        for freq in pattern.frequencies:
-            self.swe_freq_combo.addItem(f"{freq/1e6:.2f} MHz")
+        self.swe_freq_combo.addItems(labels)
+        self.swe_freq_combo.blockSignals(False)
         
         # Check if pattern has loaded SWE data
         if hasattr(pattern, 'swe') and pattern.swe:
             self.swe_calculated = True
             self._display_loaded_swe_data()
-            
+
             # Enable near field calculation since SWE data exists
-            self.calculate_nf_btn.setEnabled(True)
+            self._set_nf_enabled(True)
 
             # Keep SWE calculation button enabled (can recalculate)
             self.calculate_swe_btn.setEnabled(True)
         else:
             self.swe_calculated = False
-            
+
             # Enable SWE calculation
             self.calculate_swe_btn.setEnabled(True)
-            
+
             # Disable near field until SWE is calculated
-            self.calculate_nf_btn.setEnabled(False)
-            
+            self._set_nf_enabled(False)
+
             # Clear results
             self.swe_results.clear()
-        
+
         # Clear near field results
-        self.nf_results.clear()
+        if self.nf_group.is_built():
+            self.nf_results.clear()
     
     def on_calculate_swe(self):
         """Handle calculate SWE button click."""
@@ -241,8 +273,11 @@ class AnalysisTab(QWidget):
     def on_surface_type_changed(self, surface_type):
         """Handle surface type change."""
         is_spherical = "Spherical" in surface_type
+        if not is_spherical:
+            self._ensure_plane_controls()
         self.sphere_controls_widget.setVisible(is_spherical)
-        self.plane_controls_widget.setVisible(not is_spherical)
+        if self.plane_controls_widget is not None:
+            self.plane_controls_widget.setVisible(not is_spherical)
     
     def on_calculate_nearfield(self):
         """Handle calculate near field button click."""
@@ -258,25 +293,34 @@ class AnalysisTab(QWidget):
             # This requires adding a signal to AnalysisTab
             pass
         
+    @staticmethod
+    def _total_power(swe):
+        """Total radiated power from the Q coefficients, vectorized."""
+        q1 = np.fromiter(swe.Q1_coeffs.values(), dtype=np.complex128,
+                         count=len(swe.Q1_coeffs))
+        q2 = np.fromiter(swe.Q2_coeffs.values(), dtype=np.complex128,
+                         count=len(swe.Q2_coeffs))
+        return float(np.vdot(q1, q1).real + np.vdot(q2, q2).real)
+
     def display_swe_results(self, swe):
         """Display SWE calculation results."""
         self.swe_calculated = True
-        self.calculate_nf_btn.setEnabled(True)
-        
-        result_text = "SWE Coefficients calculated:\n"
-        result_text += f"Frequency: {swe.frequency/1e9:.3f} GHz\n"
-        result_text += f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}\n"
-        
-        # Calculate total modes
+        self._set_nf_enabled(True)
+
+        # The SWE dict contents changed; drop any stale rendered text
+        self._swe_text_cache.clear()
+
         total_modes = len(swe.Q1_coeffs) + len(swe.Q2_coeffs)
-        result_text += f"Total coefficients: {total_modes}\n"
-        
-        # Calculate total power
-        total_power = sum(abs(q)**2 for q in swe.Q1_coeffs.values())
-        total_power += sum(abs(q)**2 for q in swe.Q2_coeffs.values())
-        result_text += f"Total power: {total_power:.6e} W\n"
-        
-        self.swe_results.setText(result_text)
+        total_power = self._total_power(swe)
+        parts = [
+            "SWE Coefficients calculated:\n",
+            f"Frequency: {swe.frequency/1e9:.3f} GHz\n",
+            f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}\n",
+            f"Total coefficients: {total_modes}\n",
+            f"Total power: {total_power:.6e} W\n",
+        ]
+
+        self.swe_results.setText("".join(parts))
 
     # Getter methods for processing parameters
     def get_coordinate_format(self):
@@ -300,6 +344,7 @@ class AnalysisTab(QWidget):
 
     def get_nf_sphere_params(self):
         """Get spherical surface parameters."""
+        self.nf_group.ensure_built()
         return {
             'radius': self.nf_sphere_radius_spin.value(),
             'theta_points': self.nf_theta_points_spin.value(),
@@ -308,6 +353,8 @@ class AnalysisTab(QWidget):
     
     def get_nf_plane_params(self):
         """Get planar surface parameters."""
+        self.nf_group.ensure_built()
+        self._ensure_plane_controls()
         return {
             'x_extent': self.nf_x_extent_spin.value(),
             'y_extent': self.nf_y_extent_spin.value(),
@@ -320,64 +367,86 @@ class AnalysisTab(QWidget):
         """Display SWE data that was loaded from file."""
         if not hasattr(self.current_pattern, 'swe') or not self.current_pattern.swe:
             return
-        
+
+        # Re-selection and tab switches redisplay unchanged data; serve
+        # the rendered text from the cache
+        key = id(self.current_pattern.swe)
+        cached = self._swe_text_cache.get(key)
+        if cached is not None:
+            self.swe_results.setText(cached)
+            return
+
         num_frequencies = len(self.current_pattern.swe)
         
         if num_frequencies == 1:
             # Single frequency - display detailed info
-            freq = list(self.current_pattern.swe.keys())[0]
-            swe = self.current_pattern.swe[freq]
-            
-            result_text = "SWE Coefficients (loaded from file):\n"
-            result_text += f"Frequency: {swe.frequency/1e9:.3f} GHz\n"
-            
+            swe = next(iter(self.current_pattern.swe.values()))
+
+            parts = [
+                "SWE Coefficients (loaded from file):\n",
+                f"Frequency: {swe.frequency/1e9:.3f} GHz\n",
+            ]
+
             # Calculate wavelength
-            wavelength = 299792458.0 / swe.frequency if swe.frequency else 0
+            wavelength = _SPEED_OF_LIGHT / swe.frequency if swe.frequency else 0
             if hasattr(swe, 'radius'):
-                result_text += f"Radius: {swe.radius:.4f} m ({swe.radius/wavelength:.2f} λ)\n"
-            
-            result_text += f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}\n"
-            
+                parts.append(f"Radius: {swe.radius:.4f} m "
+                             f"({swe.radius/wavelength:.2f} λ)\n")
+
+            parts.append(f"Mode indices: MMAX={swe.MMAX}, NMAX={swe.NMAX}\n")
+
             # Calculate total modes
             total_modes = len(swe.Q1_coeffs) + len(swe.Q2_coeffs)
-            result_text += f"Total coefficients: {total_modes}\n"
-            
+            parts.append(f"Total coefficients: {total_modes}\n")
+
             # Calculate total power if possible
-            total_power = sum(abs(q)**2 for q in swe.Q1_coeffs.values())
-            total_power += sum(abs(q)**2 for q in swe.Q2_coeffs.values())
-            result_text += f"Total power: {total_power:.6e} W\n"
-            
+            total_power = self._total_power(swe)
+            parts.append(f"Total power: {total_power:.6e} W\n")
+
         else:
             # Multiple frequencies - display summary
-            result_text = f"SWE Coefficients (loaded from file):\n"
-            result_text += f"{num_frequencies} frequencies with SWE data:\n\n"
-            
-            for freq, swe in self.current_pattern.swe.items():
-                result_text += f"  • {swe.frequency/1e9:.3f} GHz: "
-                result_text += f"MMAX={swe.MMAX}, NMAX={swe.NMAX}"
-                
-                if hasattr(swe, 'radius'):
-                    wavelength = 299792458.0 / swe.frequency
-                    result_text += f", R={swe.radius:.4f} m ({swe.radius/wavelength:.2f} λ)"
-                result_text += "\n"
-        
+            parts = [
+                "SWE Coefficients (loaded from file):\n",
+                f"{num_frequencies} frequencies with SWE data:\n\n",
+            ]
+
+            # SWE entries are homogeneous, so the radius check only
+            # needs to run on the first one
+            first = next(iter(self.current_pattern.swe.values()))
+            has_radius = hasattr(first, 'radius')
+
+            for swe in self.current_pattern.swe.values():
+                parts.append(f"  • {swe.frequency/1e9:.3f} GHz: "
+                             f"MMAX={swe.MMAX}, NMAX={swe.NMAX}")
+
+                if has_radius:
+                    wavelength = _SPEED_OF_LIGHT / swe.frequency
+                    parts.append(f", R={swe.radius:.4f} m "
+                                 f"({swe.radius/wavelength:.2f} λ)")
+                parts.append("\n")
+
+        result_text = "".join(parts)
+        self._swe_text_cache[key] = result_text
         self.swe_results.setText(result_text)
 
     def display_nearfield_results(self, nf_data):
         """Display near field calculation results."""
+        self.nf_group.ensure_built()
         self.nearfield_data = nf_data
         
-        surface_type = "spherical" if nf_data.get('is_spherical', True) else "planar"
-        result_text = f"Near Field Calculated ({surface_type}):\n"
-        
-        if surface_type == "spherical":
-            result_text += f"Radius: {nf_data['radius']:.4f} m\n"
-            result_text += f"Theta points: {len(nf_data['theta'])}\n"
-            result_text += f"Phi points: {len(nf_data['phi'])}\n"
+        is_spherical = nf_data.get('is_spherical', True)
+        surface_type = "spherical" if is_spherical else "planar"
+        parts = [f"Near Field Calculated ({surface_type}):\n"]
+
+        if is_spherical:
+            parts.append(f"Radius: {nf_data['radius']:.4f} m\n")
+            parts.append(f"Theta points: {len(nf_data['theta'])}\n")
+            parts.append(f"Phi points: {len(nf_data['phi'])}\n")
         else:
-            result_text += f"X extent: ±{nf_data['x_extent']:.3f} m\n"
-            result_text += f"Y extent: ±{nf_data['y_extent']:.3f} m\n"
-            result_text += f"Z distance: {nf_data['z_distance']:.4f} m\n"
-            result_text += f"Grid: {len(nf_data['x'])} × {len(nf_data['y'])} points\n"
-        
-        self.nf_results.setText(result_text)
\ No newline at end of file
+            parts.append(f"X extent: ±{nf_data['x_extent']:.3f} m\n")
+            parts.append(f"Y extent: ±{nf_data['y_extent']:.3f} m\n")
+            parts.append(f"Z distance: {nf_data['z_distance']:.4f} m\n")
+            parts.append(f"Grid: {len(nf_data['x'])} × "
+                         f"{len(nf_data['y'])} points\n")
+
+        self.nf_results.setText("".join(parts))
\ No newline at end of file
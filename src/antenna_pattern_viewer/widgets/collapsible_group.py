@@ -7,11 +7,19 @@ from PyQt6.QtCore import Qt
 
 
 class CollapsibleGroupBox(QGroupBox):
-    """A collapsible group box widget."""
-    
-    def __init__(self, title="", parent=None):
+    """
+    A collapsible group box widget.
+
+    An optional content_builder callable (taking this group box) can be
+    supplied to defer constructing the content until the group is first
+    expanded, which keeps collapsed groups free on startup.
+    """
+
+    def __init__(self, title="", parent=None, content_builder=None):
         super().__init__(title, parent)
-        
+
+        self._content_builder = content_builder
+
         # Create toggle button
         self.toggle_button = QToolButton()
         self.toggle_button.setStyleSheet("QToolButton { border: none; font-weight: bold; }")
@@ -44,7 +52,17 @@ class CollapsibleGroupBox(QGroupBox):
     def addLayout(self, layout):
         """Add layout to the content area."""
         self.content_layout.addLayout(layout)
-        
+
+    def is_built(self):
+        """Whether the deferred content (if any) has been constructed."""
+        return self._content_builder is None
+
+    def ensure_built(self):
+        """Run the deferred content builder if it hasn't run yet."""
+        if self._content_builder is not None:
+            builder, self._content_builder = self._content_builder, None
+            builder(self)
+
     def toggle_collapsed(self):
         """Toggle the collapsed state."""
         if self.content_area.isVisible():
@@ -53,7 +71,8 @@ class CollapsibleGroupBox(QGroupBox):
             self.content_area.setVisible(False)
             self.toggle_button.setChecked(False)
         else:
-            # Expand  
+            # Expand
+            self.ensure_built()
             self.toggle_button.setArrowType(Qt.ArrowType.DownArrow)
             self.content_area.setVisible(True)
             self.toggle_button.setChecked(True)
\ No newline at end of file
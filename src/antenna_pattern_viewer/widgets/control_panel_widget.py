@@ -4,6 +4,9 @@ Control panel widget containing View and Processing controls.
 Note: Analysis functionality has been moved to a separate AnalysisPanel widget.
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QSizePolicy
+from PyQt6.QtCore import QSignalBlocker, QTimer, Qt, pyqtSlot
+
+from farfield_spherical import detect_coordinate_format
 
 from antenna_pattern_viewer.widgets.view_tab import ViewTab
 from antenna_pattern_viewer.widgets.processing_tab import ProcessingTab
@@ -15,9 +18,30 @@ logger = logging.getLogger(__name__)
 class ControlPanelWidget(QWidget):
     """Control panel with tabbed interface for View and Processing controls."""
 
+    # Lowercased combo text / format string -> canonical coordinate format
+    _COORD_FORMAT_MAP = {"central": "central", "sided": "sided"}
+
     def __init__(self, data_model, parent=None):
         super().__init__(parent)
         self.data_model = data_model
+        # Coordinate format of the loaded pattern, detected once per
+        # load instead of on every combo change
+        self._original_coord_format = None
+        # Tabs refresh lazily: pattern changes mark them dirty and only
+        # the visible tab updates immediately, hidden ones catch up
+        # when shown
+        self._view_dirty = False
+        self._processing_dirty = False
+        # Last view-tab parameter snapshot, for diffing out no-op
+        # emissions during slider drags
+        self._last_view_params = None
+        # Debounce timer coalescing back-to-back refresh requests
+        # (slider drags, processing toggles) into one
+        # view_parameters_changed emission per ~frame
+        self._view_emit_timer = QTimer(self)
+        self._view_emit_timer.setSingleShot(True)
+        self._view_emit_timer.setInterval(16)
+        self._view_emit_timer.timeout.connect(self._emit_view_params_changed)
         self.setup_ui()
         self.connect_signals()
 
@@ -29,13 +53,16 @@ class ControlPanelWidget(QWidget):
         # Create tab widget
         self.tab_widget = QTabWidget()
 
-        # Create tabs (View and Processing only - Analysis moved to separate panel)
+        # Create the View tab eagerly; the Processing tab is deferred
+        # until the user first visits it, so startup only pays for the
+        # widgets that are actually visible
         self.view_tab = ViewTab()
-        self.processing_tab = ProcessingTab()
-
-        # Add tabs
         self.tab_widget.addTab(self.view_tab, "View")
-        self.tab_widget.addTab(self.processing_tab, "Processing")
+
+        self.processing_tab = None
+        self._processing_index = self.tab_widget.addTab(QWidget(),
+                                                        "Processing")
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tab_widget)
 
@@ -47,8 +74,22 @@ class ControlPanelWidget(QWidget):
         # When view parameters change, update data model
         self.view_tab.parameters_changed.connect(self.on_view_params_changed)
 
-        # When pattern is loaded/modified, update tabs
-        self.data_model.pattern_loaded.connect(self.on_pattern_loaded)
+        # When pattern is loaded/modified, update tabs. Queued so the
+        # loader returns immediately and the widget repopulation
+        # interleaves with paint events instead of blocking them
+        self.data_model.pattern_loaded.connect(
+            self.on_pattern_loaded, Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index):
+        """Build deferred tab contents on first visit, then catch up."""
+        if index == self._processing_index and self.processing_tab is None:
+            self._build_processing_tab()
+        self._refresh_visible()
+
+    def _build_processing_tab(self):
+        """Construct the Processing tab and swap out its placeholder."""
+        self.processing_tab = ProcessingTab()
 
         # Connect processing signals
         self.processing_tab.apply_phase_center_signal.connect(self.on_apply_phase_center)
@@ -59,28 +100,100 @@ class ControlPanelWidget(QWidget):
         self.processing_tab.shift_phi_origin_signal.connect(self.on_shift_phi_origin)
         self.processing_tab.normalize_amplitude_signal.connect(self.on_normalize_amplitude)
 
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.removeTab(self._processing_index)
+        self.tab_widget.insertTab(self._processing_index,
+                                  self.processing_tab, "Processing")
+        self.tab_widget.setCurrentIndex(current)
+
+        # Catch the new tab up with any pattern loaded before the build
+        self._sync_tab(self.processing_tab)
+        self._processing_dirty = False
+
+    def _sync_tab(self, tab):
+        """Run update_pattern on one tab with its signals blocked."""
+        pattern = self.data_model.pattern
+        if pattern is not None:
+            with QSignalBlocker(tab):
+                tab.update_pattern(pattern)
+
+    def _mark_all_dirty(self):
+        """Flag every tab as stale after a pattern change."""
+        self._view_dirty = True
+        self._processing_dirty = True
+
+    def _refresh_visible(self):
+        """Refresh the currently visible tab if it is stale."""
+        current = self.tab_widget.currentWidget()
+        if current is self.view_tab and self._view_dirty:
+            self._sync_tab(self.view_tab)
+            self._view_dirty = False
+        elif current is self.processing_tab and self._processing_dirty:
+            self._sync_tab(self.processing_tab)
+            self._processing_dirty = False
+
+    def _request_refresh(self):
+        """Request a coalesced plot refresh."""
+        self._view_emit_timer.start()
+
+    def _emit_view_params_changed(self):
+        """Emit the coalesced view-parameters-changed notification."""
+        self.data_model.view_parameters_changed.emit(self.data_model._view_params)
+
+    @pyqtSlot()
     def on_view_params_changed(self):
         """Handle view parameter changes from view tab."""
-        # Extract parameters from view tab and update model
+        # Extract parameters from view tab and diff against the last
+        # snapshot; widgets re-emitting unchanged values are dropped
         params = self.view_tab.get_current_parameters()
-        self.data_model.update_view_params(params)
-        
-        # Trigger plot update through data model
-        self.data_model.view_parameters_changed.emit(params)
+        last = self._last_view_params
+        if last is not None:
+            diff = {k: v for k, v in params.items() if last.get(k) != v}
+            if not diff:
+                return
+        else:
+            diff = params
+        self._last_view_params = params
+
+        # Merge into the model directly; update_view_params would emit
+        # synchronously and bypass the debounce below
+        self.data_model._view_params.update(diff)
+
+        # Trigger plot update through data model (debounced, so slider
+        # drags collapse to ~one redraw per frame)
+        self._request_refresh()
     
+    @pyqtSlot(object)
     def on_pattern_loaded(self, pattern):
         """Update all tabs when new pattern is loaded."""
-        self.view_tab.update_pattern(pattern)
-        self.processing_tab.update_pattern(pattern)
+        # Block the tabs' own signals while their widgets are rewritten
+        # so programmatic updates don't cascade back into the model;
+        # one debounced refresh follows instead
+        self._last_view_params = None
+        self._mark_all_dirty()
+        self._refresh_visible()
+        if self.processing_tab is not None:
+            # Reset processing state
+            with QSignalBlocker(self.processing_tab):
+                self.processing_tab.reset_processing_state()
+        self._request_refresh()
 
-        # Reset processing state
-        self.processing_tab.reset_processing_state()
+        # Detect the loaded pattern's coordinate format once; the
+        # format combo handler compares against it on every change
+        try:
+            self._original_coord_format = detect_coordinate_format(pattern)
+        except Exception as e:
+            self._original_coord_format = None
+            logger.error(f"Failed to detect coordinate format: {e}")
 
+    @pyqtSlot(object)
     def on_pattern_modified(self, pattern):
         """Update tabs when pattern is modified."""
-        self.view_tab.update_pattern(pattern)
-        self.processing_tab.update_pattern(pattern)
+        self._mark_all_dirty()
+        self._refresh_visible()
+        self._request_refresh()
     
+    @pyqtSlot(float, float, float, float)
     def on_apply_phase_center(self, x, y, z, frequency):
         """Handle phase center translation toggle."""
         if self.data_model.original_pattern is None:
@@ -98,14 +211,13 @@ class ControlPanelWidget(QWidget):
                 self.data_model.set_phase_center_translation(None)
             
             # Update our tabs
-            self.processing_tab.update_pattern(self.data_model.pattern)
+            self._processing_dirty = True
+            self._refresh_visible()
             
-            # Trigger plot update
-            self.data_model.view_parameters_changed.emit(self.data_model._view_params)
-            
-        except Exception as e:
-            print(f"Failed to toggle phase center translation: {e}", exc_info=True)
+        except Exception:
+            logger.exception("Failed to toggle phase center translation")
 
+    @pyqtSlot(float)
     def on_apply_mars(self, max_extent):
         """Handle MARS toggle."""
         if self.data_model.original_pattern is None:
@@ -123,27 +235,28 @@ class ControlPanelWidget(QWidget):
                 self.data_model.set_mars(None)
             
             # Update our tabs
-            self.processing_tab.update_pattern(self.data_model.pattern)
+            self._processing_dirty = True
+            self._refresh_visible()
             
-            # Trigger plot update
-            self.data_model.view_parameters_changed.emit(self.data_model._view_params)
-            
-        except Exception as e:
-            print(f"Failed to toggle MARS: {e}", exc_info=True)
+        except Exception:
+            logger.exception("Failed to toggle MARS")
 
+    @pyqtSlot(str)
     def on_coordinate_format_changed(self, new_format):
         """Handle coordinate format change request."""
         if self.data_model.original_pattern is None:
             return
         
         try:
-            # Detect original format
-            from farfield_spherical import detect_coordinate_format
-            original_format = detect_coordinate_format(self.data_model.original_pattern)
-            
+            # Use the format detected at load time; fall back to a
+            # fresh detection if the pattern predates the cache
+            original_format = self._original_coord_format
+            if original_format is None:
+                original_format = detect_coordinate_format(self.data_model.original_pattern)
+                self._original_coord_format = original_format
+
             # Map combo text to format string
-            format_map = {"Central": "central", "Sided": "sided", "central": "central", "sided": "sided"}
-            target_format = format_map.get(new_format)
+            target_format = self._COORD_FORMAT_MAP.get(new_format.lower())
             
             # Only transform if different from original
             if target_format != original_format:
@@ -153,14 +266,13 @@ class ControlPanelWidget(QWidget):
                 self.data_model.set_coordinate_format(None)
             
             # Update our tabs
-            self.processing_tab.update_pattern(self.data_model.pattern)
+            self._processing_dirty = True
+            self._refresh_visible()
             
-            # Trigger plot update
-            self.data_model.view_parameters_changed.emit(self.data_model._view_params)
-            
-        except Exception as e:
-            print(f"Failed to change coordinate format: {e}", exc_info=True)
+        except Exception:
+            logger.exception("Failed to change coordinate format")
 
+    @pyqtSlot(str)
     def on_polarization_changed(self, new_polarization):
         """Handle polarization change request."""
         if self.data_model.pattern is None:
@@ -180,16 +292,15 @@ class ControlPanelWidget(QWidget):
             self.data_model.processing_applied.emit("polarization_conversion")
             
             # Update our tabs
-            self.processing_tab.update_pattern(pattern)
+            self._processing_dirty = True
+            self._refresh_visible()
             
-            # Trigger plot update
-            self.data_model.view_parameters_changed.emit(self.data_model._view_params)
-            
-        except Exception as e:
-            print(f"Failed to convert polarization: {e}")
+        except Exception:
+            logger.exception("Failed to convert polarization")
 
     # Note: SWE and Near Field calculation methods moved to AnalysisPanel
 
+    @pyqtSlot(float)
     def on_shift_theta_origin(self, theta_offset):
         """Handle theta origin shift toggle."""
         if self.data_model.original_pattern is None:
@@ -205,12 +316,13 @@ class ControlPanelWidget(QWidget):
                 self.data_model.set_theta_origin_shift(None)
                 logger.info("Theta origin shift disabled")
             
-            self.processing_tab.update_pattern(self.data_model.pattern)
-            self.data_model.view_parameters_changed.emit(self.data_model._view_params)
+            self._processing_dirty = True
+            self._refresh_visible()
             
         except Exception as e:
             logger.error(f"Failed to toggle theta origin shift: {e}", exc_info=True)
 
+    @pyqtSlot(float)
     def on_shift_phi_origin(self, phi_offset):
         """Handle phi origin shift toggle."""
         if self.data_model.original_pattern is None:
@@ -226,12 +338,13 @@ class ControlPanelWidget(QWidget):
                 self.data_model.set_phi_origin_shift(None)
                 logger.info("Phi origin shift disabled")
             
-            self.processing_tab.update_pattern(self.data_model.pattern)
-            self.data_model.view_parameters_changed.emit(self.data_model._view_params)
+            self._processing_dirty = True
+            self._refresh_visible()
             
         except Exception as e:
             logger.error(f"Failed to toggle phi origin shift: {e}", exc_info=True)
 
+    @pyqtSlot(str)
     def on_normalize_amplitude(self, norm_type):
         """Handle amplitude normalization toggle."""
         if self.data_model.original_pattern is None:
@@ -251,10 +364,8 @@ class ControlPanelWidget(QWidget):
                 logger.info("Amplitude normalization disabled")
             
             # Update tabs
-            self.processing_tab.update_pattern(self.data_model.pattern)
-            
-            # Trigger plot update
-            self.data_model.view_parameters_changed.emit(self.data_model._view_params)
+            self._processing_dirty = True
+            self._refresh_visible()
             
         except Exception as e:
             logger.error(f"Failed to toggle amplitude normalization: {e}", exc_info=True)
\ No newline at end of file
@@ -3,7 +3,13 @@ Data display widget showing numerical information and statistics.
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                               QTableWidget, QGroupBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
+import weakref
+
+# Sentinel for "no deferred update": None is a valid pending value
+# (the pattern can be unloaded while the widget is hidden)
+_NO_PENDING = object()
+
 
 class DataDisplayWidget(QWidget):
     """Widget for displaying numerical data and statistics."""
@@ -11,6 +17,11 @@ class DataDisplayWidget(QWidget):
     def __init__(self, data_model, parent=None):
         super().__init__(parent)
         self.data_model = data_model
+        # Pattern waiting to be rendered while the widget is hidden
+        self._pending_pattern = _NO_PENDING
+        # Rendered info text per pattern object; pattern mutations go
+        # through copies, so a given object's summary never changes
+        self._info_cache = weakref.WeakKeyDictionary()
         self.setup_ui()
         self.connect_signals()
     
@@ -49,12 +60,37 @@ class DataDisplayWidget(QWidget):
         self.data_model.pattern_loaded.connect(self.on_pattern_changed)
         self.data_model.pattern_modified.connect(self.on_pattern_changed)
     
+    @pyqtSlot(object)
     def on_pattern_changed(self, pattern):
         """Update display when pattern changes."""
+        # Rebuilding the rich-text label relayouts it; defer that while
+        # the widget is hidden and catch up on show
+        if not self.isVisible():
+            self._pending_pattern = pattern
+            return
+        self._update_info(pattern)
+
+    def showEvent(self, event):
+        """Render any pattern that changed while hidden."""
+        super().showEvent(event)
+        if self._pending_pattern is not _NO_PENDING:
+            pending = self._pending_pattern
+            self._pending_pattern = _NO_PENDING
+            self._update_info(pending)
+
+    def _update_info(self, pattern):
+        """Rebuild the pattern-information label."""
         if pattern is None:
             self.info_label.setText("No pattern loaded")
             return
-        
+
+        # Re-emits for the same pattern object reuse the cached text,
+        # skipping the six array reductions below
+        info_text = self._info_cache.get(pattern)
+        if info_text is not None:
+            self.info_label.setText(info_text)
+            return
+
         # Display pattern info
         # Handle both uniform and non-uniform theta patterns
         if pattern.has_uniform_theta:
@@ -86,5 +122,6 @@ class DataDisplayWidget(QWidget):
             f"{pattern.phi_angles.max():.1f}°<br>"
             f"<b>Polarization:</b> {pattern.polarization}"
         )
-        
+
+        self._info_cache[pattern] = info_text
         self.info_label.setText(info_text)
\ No newline at end of file
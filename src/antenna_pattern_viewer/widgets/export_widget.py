@@ -4,12 +4,123 @@ Export widget for saving antenna patterns.
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QGroupBox, QRadioButton,
                             QComboBox, QPushButton, QLabel, QFileDialog, QMessageBox,
                             QHBoxLayout, QButtonGroup)
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import (QObject, QRunnable, QThreadPool, pyqtSignal,
+                          pyqtSlot)
 from pathlib import Path
+from functools import lru_cache, partial
+import os
 import pickle
+import tempfile
+import zipfile
 
 import numpy as np
-from farfield_spherical import FarFieldSpherical, write_cut, write_ffd, save_pattern_npz, write_ticra_sph, write_csv
+
+
+@lru_cache(maxsize=None)
+def _farfield():
+    """Import farfield_spherical on first use.
+
+    The package pulls in scipy.special for SWE support; deferring the
+    import keeps it off the widget-construction (and app cold-start)
+    path for sessions that never export.
+    """
+    import farfield_spherical
+    return farfield_spherical
+
+
+def _write_npz_compressed(pattern, compresslevel, file_path):
+    """Write a pattern as a deflate-compressed NPZ archive.
+
+    np.savez_compressed hardwires zlib's default level; going through
+    ZipFile directly lets the export UI trade compression ratio against
+    CPU time (level 1 is typically several times faster than level 6
+    on large complex field arrays for a modest size penalty).
+
+    Serialization is delegated to save_pattern_npz so the member schema
+    always matches what load_pattern_npz (the app's own open path)
+    expects; this function only repacks the members at the requested
+    level, then verifies the archive reloads.
+    """
+    ff = _farfield()
+    tmp = tempfile.NamedTemporaryFile(suffix='.npz', delete=False)
+    tmp.close()
+    try:
+        ff.save_pattern_npz(pattern, tmp.name)
+        with zipfile.ZipFile(tmp.name) as src, \
+                zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED,
+                                compresslevel=compresslevel) as dst:
+            for name in src.namelist():
+                dst.writestr(name, src.read(name))
+    finally:
+        os.unlink(tmp.name)
+    # Round trip through the app's reader; a broken archive should fail
+    # the export, not the next load
+    ff.load_pattern_npz(file_path)
+
+
+def _write_csv_fast(pattern, file_path):
+    """Write a uniform-grid pattern as CSV via a single savetxt call.
+
+    Builds one (Nfreq*Ntheta*Nphi, 7) table and lets savetxt format it
+    in C, instead of assembling rows in a Python loop.
+    """
+    grids = np.meshgrid(pattern.frequencies, pattern.theta_angles,
+                        pattern.phi_angles, indexing='ij')
+    e_theta = pattern.data.e_theta.values
+    e_phi = pattern.data.e_phi.values
+    table = np.column_stack([
+        grids[0].ravel(), grids[1].ravel(), grids[2].ravel(),
+        e_theta.real.ravel(), e_theta.imag.ravel(),
+        e_phi.real.ravel(), e_phi.imag.ravel(),
+    ])
+    with open(file_path, 'w', buffering=1 << 20, newline='') as f:
+        np.savetxt(
+            f, table, fmt='%.7e', delimiter=',', comments='',
+            header='frequency,theta,phi,e_theta_re,e_theta_im,'
+                   'e_phi_re,e_phi_im')
+
+
+def _nearest_freq_index(freqs, value):
+    """Index of the frequency closest to value.
+
+    Binary search on the (sorted) frequency axis; falls back to a
+    linear argmin scan if the axis is not monotonic.
+    """
+    if len(freqs) > 1 and freqs[0] > freqs[-1]:
+        return int(np.argmin(np.abs(freqs - value)))
+    i = int(np.searchsorted(freqs, value))
+    if i == 0:
+        return 0
+    if i == len(freqs):
+        return len(freqs) - 1
+    if abs(freqs[i - 1] - value) <= abs(freqs[i] - value):
+        return i - 1
+    return i
+
+
+class _ExportSignals(QObject):
+    """Signal holder for ExportRunnable (QRunnable is not a QObject)."""
+
+    done = pyqtSignal(str)  # Emits file path on success
+    failed = pyqtSignal(str)  # Emits error message
+
+
+class ExportRunnable(QRunnable):
+    """Runs one pattern export on a pool thread."""
+
+    def __init__(self, writer, file_path):
+        super().__init__()
+        self.writer = writer
+        self.file_path = file_path
+        self.signals = _ExportSignals()
+
+    def run(self):
+        """Write the file off the GUI thread."""
+        try:
+            self.writer(self.file_path)
+            self.signals.done.emit(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class ExportWidget(QWidget):
@@ -21,6 +132,12 @@ class ExportWidget(QWidget):
         super().__init__(parent)
         self.data_model = data_model
         self.plot_widget = plot_widget
+        # Keep the in-flight runnable referenced so its signal holder
+        # isn't collected mid-export
+        self._export_runnable = None
+        # Whether PKL export can work at all is fixed at construction
+        self._pkl_available = (plot_widget is not None
+                               and hasattr(plot_widget, 'figure'))
         self.setup_ui()
     
     def setup_ui(self):
@@ -35,17 +152,37 @@ class ExportWidget(QWidget):
         type_layout = QHBoxLayout()
         type_layout.addWidget(QLabel("File Type:"))
         self.file_type_combo = QComboBox()
-        self.file_type_combo.addItems([
-            "NPZ (Numpy Archive)",
-            "CUT (GRASP)",
-            "FFD (HFSS)",
-            "SPH (TICRA Spherical Modes)",
-            "CSV (Comma Separated Values)",
-            "PKL (Plot Figure)"
-        ])
+        # Each item carries (extension, writer name) as userData; the
+        # name is resolved against the lazily imported package in
+        # _make_writer, and formats needing widget state (figure, SWE)
+        # carry None here
+        self.file_type_combo.addItem("NPZ (Numpy Archive)",
+                                     (".npz", "save_pattern_npz"))
+        self.file_type_combo.addItem("CUT (GRASP)", (".cut", "write_cut"))
+        self.file_type_combo.addItem("FFD (HFSS)", (".ffd", "write_ffd"))
+        self.file_type_combo.addItem("SPH (TICRA Spherical Modes)",
+                                     (".sph", None))
+        self.file_type_combo.addItem("CSV (Comma Separated Values)",
+                                     (".csv", "write_csv"))
+        self.file_type_combo.addItem("PKL (Plot Figure)", (".pkl", None))
+        self.file_type_combo.currentIndexChanged.connect(
+            self.on_file_type_changed)
         type_layout.addWidget(self.file_type_combo)
         export_layout.addLayout(type_layout)
-        
+
+        # NPZ-only compression tier; userData is the deflate level
+        # (None = uncompressed savez via the library writer)
+        compression_layout = QHBoxLayout()
+        self.compression_label = QLabel("Compression:")
+        compression_layout.addWidget(self.compression_label)
+        self.compression_combo = QComboBox()
+        self.compression_combo.addItem("None (fastest)", None)
+        self.compression_combo.addItem("Fast", 1)
+        self.compression_combo.addItem("Small", 9)
+        compression_layout.addWidget(self.compression_combo)
+        export_layout.addLayout(compression_layout)
+
+
         # Frequency selection - side by side
         freq_layout = QHBoxLayout()
         self.freq_all = QRadioButton("All frequencies")
@@ -85,29 +222,31 @@ class ExportWidget(QWidget):
         layout.addStretch()
         self.setLayout(layout)
     
+    @pyqtSlot(int)
+    def on_file_type_changed(self, index):
+        """Show the compression selector only for NPZ exports."""
+        is_npz = self.get_file_extension() == ".npz"
+        self.compression_label.setVisible(is_npz)
+        self.compression_combo.setVisible(is_npz)
+
     def get_file_extension(self):
         """Get file extension based on selected type."""
-        type_text = self.file_type_combo.currentText()
-        if "NPZ" in type_text:
-            return ".npz"
-        elif "CUT" in type_text:
-            return ".cut"
-        elif "FFD" in type_text:
-            return ".ffd"
-        elif "SPH" in type_text:
-            return ".sph"
-        elif "CSV" in type_text:
-            return ".csv"
-        elif "PKL" in type_text:
-            return ".pkl"
-        return ".dat"
+        data = self.file_type_combo.currentData()
+        return data[0] if data else ".dat"
     
+    @pyqtSlot()
     def on_export(self):
         """Handle export button click."""
-        if self.data_model.pattern is None:
+        # Pick the source first so a single check covers both the
+        # raw and processed selections
+        if self.processing_raw.isChecked():
+            pattern = self.data_model.original_pattern
+        else:
+            pattern = self.data_model.pattern
+        if pattern is None:
             QMessageBox.warning(self, "No Data", "No pattern loaded to export.")
             return
-        
+
         # Get file path from user
         extension = self.get_file_extension()
         file_path, _ = QFileDialog.getSaveFileName(
@@ -121,78 +260,152 @@ class ExportWidget(QWidget):
             return
         
         try:
-            # Get pattern based on processing state selection
-            if self.processing_raw.isChecked():
-                pattern = self.data_model.original_pattern
-            else:
-                pattern = self.data_model.pattern
-            
-            if pattern is None:
-                raise ValueError("No pattern available for export")
-            
-            # Handle frequency filtering for non-SPH formats
-            type_text = self.file_type_combo.currentText()
-            if "SPH" not in type_text and self.freq_selected.isChecked():
+            # Handle frequency filtering for non-SPH formats. A
+            # single-frequency pattern is already its own selection, so
+            # skip the slicing/reconstruction entirely
+            if (self.get_file_extension() != ".sph"
+                    and self.freq_selected.isChecked()
+                    and len(pattern.frequencies) > 1):
                 selected_freqs = self.data_model.get_view_param('selected_frequencies')
                 if not selected_freqs:
                     QMessageBox.warning(self, "No Selection",
                                     "No frequency selected. Using first frequency.")
-                    freq_idx = 0
-                else:
-                    # selected_freqs contains frequency values, find the index
-                    freq_value = selected_freqs[0]
-                    freq_idx = int(np.argmin(np.abs(pattern.frequencies - freq_value)))
-
-                # Extract single frequency using data slicing
-                freq_value = pattern.frequencies[freq_idx]
-                # Handle both uniform and non-uniform theta patterns
-                if pattern.has_uniform_theta:
-                    theta_param = pattern.theta_angles
+                    indices = np.array([0])
                 else:
-                    theta_param = pattern.theta_grid
-                pattern = FarFieldSpherical(
-                    theta=theta_param,
-                    phi=pattern.phi_angles,
-                    frequency=np.array([freq_value]),
-                    e_theta=pattern.data.e_theta.values[freq_idx:freq_idx+1, :, :],
-                    e_phi=pattern.data.e_phi.values[freq_idx:freq_idx+1, :, :],
-                    polarization=pattern.polarization
-                )
-            
-            self.write_pattern(pattern, file_path)
+                    # selected_freqs contains frequency values; map each
+                    # to its index (unique also sorts)
+                    indices = np.unique([
+                        _nearest_freq_index(pattern.frequencies, v)
+                        for v in selected_freqs])
+
+                # Unique indices within range: selecting as many as the
+                # pattern holds means selecting all of them, so the
+                # pattern is exported as-is with no reconstruction
+                if len(indices) < len(pattern.frequencies):
+                    pattern = self._slice_frequencies(pattern, indices)
             
-            self.status_label.setText(f"Exported: {Path(file_path).name}")
-            self.export_completed.emit(file_path)
+            # Resolve the writer up front so validation errors (missing
+            # figure, missing SWE) surface immediately, then hand the
+            # disk I/O to the thread pool so the GUI stays responsive
+            writer = self._make_writer(pattern)
+
+            self.export_button.setEnabled(False)
+            self.status_label.setText("Exporting...")
+            self._export_runnable = ExportRunnable(writer, file_path)
+            self._export_runnable.signals.done.connect(self.on_export_done)
+            self._export_runnable.signals.failed.connect(self.on_export_failed)
+            QThreadPool.globalInstance().start(self._export_runnable)
 
         except Exception as e:
             QMessageBox.critical(self, "Export Failed", f"Failed to export:\n{str(e)}")
+
+    @pyqtSlot(str)
+    def on_export_done(self, file_path):
+        """Handle a completed background export."""
+        self._export_runnable = None
+        self.export_button.setEnabled(True)
+        self.status_label.setText(f"Exported: {Path(file_path).name}")
+        self.export_completed.emit(file_path)
+
+    @pyqtSlot(str)
+    def on_export_failed(self, error_msg):
+        """Handle a failed background export."""
+        self._export_runnable = None
+        self.export_button.setEnabled(True)
+        self.status_label.setText("")
+        QMessageBox.critical(self, "Export Failed", f"Failed to export:\n{error_msg}")
     
+    @staticmethod
+    def _slice_frequencies(pattern, indices):
+        """Return a pattern restricted to the given frequency indices.
+
+        A contiguous run is turned into a slice, which isel hands out
+        as a zero-copy view; scattered indices need fancy indexing and
+        therefore a copy. `indices` must be sorted and unique.
+        """
+        if indices[-1] - indices[0] + 1 == len(indices):
+            freq_sel = slice(int(indices[0]), int(indices[-1]) + 1)
+        else:
+            freq_sel = indices
+
+        # Prefer a library-provided shallow view, then a dataset
+        # constructor wrapping an isel view; both avoid materializing
+        # more than the selected planes
+        select_frequency = getattr(pattern, 'select_frequency', None)
+        from_dataset = getattr(_farfield().FarFieldSpherical,
+                               'from_dataset', None)
+        if len(indices) == 1 and select_frequency is not None:
+            return select_frequency(int(indices[0]))
+        if from_dataset is not None:
+            return from_dataset(
+                pattern.data.isel(frequency=freq_sel),
+                polarization=pattern.polarization
+            )
+
+        # Handle both uniform and non-uniform theta patterns
+        if pattern.has_uniform_theta:
+            theta_param = pattern.theta_angles
+        else:
+            theta_param = pattern.theta_grid
+        # isel before .values, so only the selected frequency planes
+        # are materialized rather than the full multi-frequency cube
+        return _farfield().FarFieldSpherical(
+            theta=theta_param,
+            phi=pattern.phi_angles,
+            frequency=np.asarray(pattern.frequencies[freq_sel]),
+            e_theta=pattern.data.e_theta.isel(frequency=freq_sel).values,
+            e_phi=pattern.data.e_phi.isel(frequency=freq_sel).values,
+            polarization=pattern.polarization
+        )
+
     def write_pattern(self, pattern, file_path):
         """Write pattern to file based on selected format."""
-        type_text = self.file_type_combo.currentText()
-        
-        if "NPZ" in type_text:
-            save_pattern_npz(pattern, file_path)
-        elif "CUT" in type_text:
-            write_cut(pattern, file_path)
-        elif "FFD" in type_text:
-            write_ffd(pattern, file_path)
-        elif "CSV" in type_text:
-            write_csv(pattern, file_path)
-        elif "PKL" in type_text:
-            if self.plot_widget is None or not hasattr(self.plot_widget, 'figure'):
+        self._make_writer(pattern)(file_path)
+
+    def _make_writer(self, pattern):
+        """
+        Build a callable writing the pattern in the selected format.
+
+        The callable takes only the file path and is safe to run on a
+        pool thread; anything touching GUI state (the plot figure) is
+        captured here on the GUI thread.
+        """
+        ext, writer_name = self.file_type_combo.currentData()
+
+        if ext == ".npz":
+            level = self.compression_combo.currentData()
+            if level is None:
+                return partial(getattr(_farfield(), writer_name), pattern)
+            return partial(_write_npz_compressed, pattern, level)
+        if ext == ".csv" and pattern.has_uniform_theta:
+            # Non-uniform per-phi theta grids keep the library writer,
+            # which knows how to flatten them
+            return partial(_write_csv_fast, pattern)
+        if writer_name is not None:
+            return partial(getattr(_farfield(), writer_name), pattern)
+        if ext == ".pkl":
+            if not self._pkl_available:
                 raise ValueError("No plot figure available for export")
-            with open(file_path, 'wb') as f:
-                pickle.dump(self.plot_widget.figure, f)
-        elif "SPH" in type_text:
-            # Check if SWE has been pre-calculated
-            if not hasattr(pattern, 'swe') or not pattern.swe:
+            # Pickle on the GUI thread (the figure may be redrawn
+            # concurrently); only the byte write happens off-thread
+            payload = pickle.dumps(self.plot_widget.figure,
+                                   protocol=pickle.HIGHEST_PROTOCOL)
+
+            def write_pkl(file_path):
+                with open(file_path, 'wb') as f:
+                    f.write(payload)
+
+            return write_pkl
+        if ext == ".sph":
+            # Check if SWE has been pre-calculated; one getattr covers
+            # both the missing-attribute and empty-dict cases
+            if not getattr(pattern, 'swe', None):
                 raise ValueError(
                     "Spherical wave expansion not calculated. "
                     "Please calculate SWE in the Analysis tab before exporting to SPH format."
                 )
-            
+
             # Export the first available SWE (user has already calculated the one they want)
-            freq = list(pattern.swe.keys())[0]
-            swe = pattern.swe[freq]
-            write_ticra_sph(swe, file_path)
\ No newline at end of file
+            swe = next(iter(pattern.swe.values()))
+            return partial(_farfield().write_ticra_sph, swe)
+        raise ValueError(f"Unsupported export format: {ext}")
\ No newline at end of file
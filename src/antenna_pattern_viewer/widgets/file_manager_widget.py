@@ -26,6 +26,12 @@ import os
 from farfield_spherical import read_cut, read_ffd, load_pattern_npz, read_atams
 from ..pattern_instance import PatternInstance
 
+# Static os.path checks skip the Path-object construction that
+# Path(x).exists()/.is_dir()/.is_file() pay on every call
+_exists = os.path.exists
+_isdir = os.path.isdir
+_isfile = os.path.isfile
+
 
 class CutFileDialog(QDialog):
     """Dialog for getting frequency information for .cut files."""
@@ -205,6 +211,9 @@ class FileManagerWidget(QWidget):
     MAX_RECENT_FILES = 10
     MAX_RECENT_LOCATIONS = 5
 
+    # How long a memoized existence check stays valid (seconds)
+    EXISTS_TTL = 3.0
+
     SUPPORTED_EXTENSIONS = ["*.cut", "*.ffd", "*.npz", "*.sph", "*.atams"]
     FILE_FILTER = "Pattern Files (*.cut *.ffd *.npz *.sph *.atams);;All Files (*)"
 
@@ -215,18 +224,60 @@ class FileManagerWidget(QWidget):
         self.recent_files = []
         self.recent_locations = []
         self.favorites = []
+        # path -> (monotonic timestamp, exists); see _path_exists
+        self._exists_cache = {}
 
         self.load_settings()
         self.setup_ui()
         self.connect_signals()
         self.setAcceptDrops(True)
 
+    def _path_exists(self, path) -> bool:
+        """Existence check memoized for a few seconds.
+
+        Each load refreshes the quick access list and recent menu, both
+        of which re-stat the same favorites, default locations and
+        recent files; on networked drives every stat is a round trip.
+        """
+        key = str(path)
+        now = time.monotonic()
+        cached = self._exists_cache.get(key)
+        if cached is not None and now - cached[0] < self.EXISTS_TTL:
+            return cached[1]
+        result = _exists(key)
+        self._exists_cache[key] = (now, result)
+        return result
+
+    def _prime_exists_cache(self, paths):
+        """Seed _path_exists results with one scandir per directory.
+
+        Recent files typically cluster in a couple of folders, so one
+        directory listing replaces a stat per file.
+        """
+        now = time.monotonic()
+        by_dir = {}
+        for p in paths:
+            key = str(p)
+            cached = self._exists_cache.get(key)
+            if cached is not None and now - cached[0] < self.EXISTS_TTL:
+                continue
+            by_dir.setdefault(os.path.dirname(key), []).append(key)
+        for dir_path, members in by_dir.items():
+            try:
+                with os.scandir(dir_path) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            for key in members:
+                self._exists_cache[key] = (now,
+                                           os.path.basename(key) in names)
+
     def load_settings(self):
         """Load saved settings."""
         self.recent_files = self.settings.value(self.SETTINGS_RECENT_FILES, []) or []
         self.favorites = self.settings.value(self.SETTINGS_FAVORITES, []) or []
         last_dir = self.settings.value(self.SETTINGS_LAST_DIR, QDir.homePath())
-        self.current_directory = last_dir if Path(last_dir).exists() else QDir.homePath()
+        self.current_directory = last_dir if self._path_exists(last_dir) else QDir.homePath()
 
         # Extract recent locations from recent files
         self._update_recent_locations()
@@ -343,6 +394,8 @@ class FileManagerWidget(QWidget):
 
         # Quick access list
         self.quick_access_list = QListWidget()
+        # All rows are single-line labels, so let Qt size them once
+        self.quick_access_list.setUniformItemSizes(True)
         self.quick_access_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.quick_access_list.customContextMenuRequested.connect(self.show_quick_access_menu)
         self.quick_access_list.itemDoubleClicked.connect(self.on_quick_access_clicked)
@@ -360,6 +413,18 @@ class FileManagerWidget(QWidget):
 
     def _refresh_quick_access(self):
         """Refresh quick access list."""
+        self._prime_exists_cache(self.favorites + self.recent_locations)
+        # Suppress per-item relayout/repaint while the list is rebuilt
+        self.quick_access_list.setUpdatesEnabled(False)
+        self.quick_access_list.blockSignals(True)
+        try:
+            self._rebuild_quick_access_items()
+        finally:
+            self.quick_access_list.blockSignals(False)
+            self.quick_access_list.setUpdatesEnabled(True)
+
+    def _rebuild_quick_access_items(self):
+        """Repopulate the quick access list items."""
         self.quick_access_list.clear()
 
         # Add default locations
@@ -369,9 +434,9 @@ class FileManagerWidget(QWidget):
 
         # Default locations section
         self.quick_access_list.addItem(QuickAccessItem("Home", home, "~"))
-        if Path(desktop).exists():
+        if self._path_exists(desktop):
             self.quick_access_list.addItem(QuickAccessItem("Desktop", desktop, "~"))
-        if Path(documents).exists():
+        if self._path_exists(documents):
             self.quick_access_list.addItem(QuickAccessItem("Documents", documents, "~"))
 
         # Separator
@@ -382,7 +447,7 @@ class FileManagerWidget(QWidget):
 
         # Favorites
         for fav in self.favorites:
-            if Path(fav).exists():
+            if self._path_exists(fav):
                 name = Path(fav).name or fav
                 self.quick_access_list.addItem(QuickAccessItem(name, fav, "★"))
 
@@ -394,7 +459,7 @@ class FileManagerWidget(QWidget):
             self.quick_access_list.addItem(sep_item2)
 
             for loc in self.recent_locations:
-                if Path(loc).exists():
+                if self._path_exists(loc):
                     name = Path(loc).name or loc
                     self.quick_access_list.addItem(QuickAccessItem(name, loc, ""))
 
@@ -413,6 +478,9 @@ class FileManagerWidget(QWidget):
 
         # File tree view
         self.file_tree = QTreeView()
+        # Single-line rows throughout: uniform heights make viewport
+        # geometry O(1) instead of measuring every row in large folders
+        self.file_tree.setUniformRowHeights(True)
         self.file_tree.setModel(self.file_model)
         self.file_tree.setRootIndex(self.file_model.index(self.current_directory))
         self.file_tree.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
@@ -477,9 +545,9 @@ class FileManagerWidget(QWidget):
         file_paths = set()
         for index in selected_indexes:
             if index.column() == 0:
-                file_path = Path(self.file_model.filePath(index))
-                if file_path.is_file():
-                    file_paths.add(file_path)
+                path_str = self.file_model.filePath(index)
+                if _isfile(path_str):
+                    file_paths.add(Path(path_str))
 
         for file_path in file_paths:
             self.load_pattern_file(file_path)
@@ -555,6 +623,7 @@ class FileManagerWidget(QWidget):
 
     def _update_recent_menu(self):
         """Update the recent files menu."""
+        self._prime_exists_cache(self.recent_files)
         self.recent_menu.clear()
 
         if not self.recent_files:
@@ -564,7 +633,7 @@ class FileManagerWidget(QWidget):
 
         for file_path in self.recent_files:
             path = Path(file_path)
-            if path.exists():
+            if self._path_exists(file_path):
                 action = self.recent_menu.addAction(f"{path.name}  ({path.parent})")
                 action.setData(file_path)
                 action.triggered.connect(self._on_recent_file_clicked)
@@ -578,7 +647,7 @@ class FileManagerWidget(QWidget):
         action = self.sender()
         if action:
             file_path = action.data()
-            if file_path and Path(file_path).exists():
+            if file_path and self._path_exists(file_path):
                 self.load_pattern_file(Path(file_path))
 
     def _clear_recent_files(self):
@@ -594,7 +663,7 @@ class FileManagerWidget(QWidget):
 
     def navigate_to_path(self, path: str):
         """Navigate file browser to path."""
-        if Path(path).exists():
+        if self._path_exists(path):
             self.current_directory = path
             self.breadcrumb.set_path(path)
             self.file_tree.setRootIndex(self.file_model.index(path))
@@ -603,19 +672,19 @@ class FileManagerWidget(QWidget):
     def on_quick_access_clicked(self, item: QListWidgetItem):
         """Handle double-click on quick access item."""
         path = item.data(Qt.ItemDataRole.UserRole)
-        if path and Path(path).exists():
+        if path and self._path_exists(path):
             self.navigate_to_path(path)
 
     def on_file_double_clicked(self, index):
         """Handle double-click on file tree item."""
-        file_path = Path(self.file_model.filePath(index))
+        path_str = self.file_model.filePath(index)
 
-        if file_path.is_dir():
+        if _isdir(path_str):
             # Navigate into directory
-            self.navigate_to_path(str(file_path))
-        elif file_path.is_file():
+            self.navigate_to_path(path_str)
+        elif _isfile(path_str):
             # Load the file
-            self.load_pattern_file(file_path)
+            self.load_pattern_file(Path(path_str))
 
     def filter_files(self, text: str):
         """Filter files by search text."""
@@ -639,9 +708,9 @@ class FileManagerWidget(QWidget):
         # Get first selected file (column 0)
         for index in indexes:
             if index.column() == 0:
-                file_path = Path(self.file_model.filePath(index))
-                if file_path.is_file():
-                    self._update_preview(file_path)
+                path_str = self.file_model.filePath(index)
+                if _isfile(path_str):
+                    self._update_preview(Path(path_str))
                     return
 
         self.preview_label.setText("Select a file to see details")
@@ -2,7 +2,7 @@
 2D plot widget for antenna patterns.
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFileDialog, QMessageBox
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal
 
 from antenna_pattern_viewer.widgets.plot_widget import PlotWidget
 
@@ -29,10 +29,18 @@ class Plot2DWidget(QWidget):
     
     def connect_signals(self):
         """Connect to data model signals."""
-        self.data_model.pattern_loaded.connect(self.on_pattern_changed)
-        self.data_model.pattern_modified.connect(self.on_pattern_changed)
-        self.data_model.view_parameters_changed.connect(self.on_view_params_changed)
-        self.data_model.comparison_set_changed.connect(self.on_comparison_changed)
+        # Queued connections: these slots redraw the canvas, so emitters
+        # (processing handlers firing several signals back to back)
+        # return immediately and the redraws coalesce in the event loop
+        queued = Qt.ConnectionType.QueuedConnection
+        self.data_model.pattern_loaded.connect(self.on_pattern_changed,
+                                               queued)
+        self.data_model.pattern_modified.connect(self.on_pattern_changed,
+                                                 queued)
+        self.data_model.view_parameters_changed.connect(
+            self.on_view_params_changed, queued)
+        self.data_model.comparison_set_changed.connect(
+            self.on_comparison_changed, queued)
 
     def on_comparison_changed(self, comparison_ids):
         """Update plot when comparison set changes."""
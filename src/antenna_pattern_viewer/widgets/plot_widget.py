@@ -502,20 +502,6 @@ class PlotWidget(QWidget):
             if format_changing and hasattr(self, 'axis_limits_memory'):
                 self.restore_axis_limits('1d_cut')
 
-    def get_colorbar_limits(self):
-        """Get colorbar limits from Z-axis controls."""
-        try:
-            vmin = float(self.z_min_edit.text()) if self.z_min_edit.text().strip() else None
-        except ValueError:
-            vmin = None
-            
-        try:
-            vmax = float(self.z_max_edit.text()) if self.z_max_edit.text().strip() else None
-        except ValueError:
-            vmax = None
-            
-        return vmin, vmax
-
     def get_colorbar_limits(self):
         """Get colorbar limits from Z-axis controls."""
         try:
@@ -1,5 +1,6 @@
 """Worker threads for background processing."""
 
 from .swe_worker import SWEWorker
+from .nearfield_worker import NearFieldWorker
 
-__all__ = ['SWEWorker']
\ No newline at end of file
+__all__ = ['SWEWorker', 'NearFieldWorker']
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Worker thread for near field calculations to prevent GUI freezing.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+# Minimum number of evaluation points before a process pool pays for its
+# startup cost; smaller grids are evaluated in a single call
+_PARALLEL_MIN_POINTS = 5000
+
+# Field components carried in every nf_data dict
+_FIELD_KEYS = ('E_r', 'E_theta', 'E_phi', 'H_r', 'H_theta', 'H_phi')
+
+# Combined field-component size above which the payload is backed by
+# disk memmaps rather than held in the signal dict directly
+_MEMMAP_MIN_BYTES = 32 * 1024 * 1024
+
+# Tile size for the serial evaluation path: processing the flat points
+# in tiles caps the evaluator's transient allocations at chunk size
+# instead of six full-grid temporaries at once
+_SERIAL_CHUNK = 65536
+
+
+def _memmap_backed(arr):
+    """Copy arr into a disk-backed memmap in a fresh temp file."""
+    tmp = tempfile.NamedTemporaryFile(prefix='apv_nf_', suffix='.dat',
+                                      delete=False)
+    tmp.close()
+    mm = np.memmap(tmp.name, dtype=arr.dtype, mode='w+', shape=arr.shape)
+    mm[:] = arr
+    mm.flush()
+    return mm
+
+
+def _nf_chunk(swe, r, theta, phi):
+    """Evaluate one chunk of points."""
+    return swe.near_field(r, theta, phi)
+
+
+class NearFieldWorker(QThread):
+    """Worker thread for evaluating near fields from SWE coefficients."""
+
+    # Signals
+    finished = pyqtSignal(dict)  # Emits near field data dict when done
+    error = pyqtSignal(str)  # Emits error message
+    progress = pyqtSignal(str)  # Emits status messages during evaluation
+
+    def __init__(self, swe, surface_type, params, precision='single',
+                 phi_phasor=None):
+        """
+        Args:
+            swe: A single SWE object, or a dict of {frequency: SWE} to
+                 evaluate the same surface at every frequency
+            surface_type: "spherical" or "planar"
+            params: Surface parameter dict from the analysis panel
+            precision: 'single' downcasts the field components to
+                complex64 for display (halving payload memory);
+                'double' keeps the native complex128
+            phi_phasor: Optional precomputed exp(i m phi) table for the
+                spherical phi grid, forwarded to grid evaluators
+        """
+        super().__init__()
+        self.precision = precision
+        self.phi_phasor = phi_phasor
+        if isinstance(swe, dict):
+            self.swes = dict(swe)
+        else:
+            self.swes = None
+            self.swe = swe
+        self.surface_type = surface_type
+        self.params = params
+
+    def run(self):
+        """Run the calculation in background thread."""
+        try:
+            if self.swes is not None:
+                nf_data = self._evaluate_all_freqs()
+            else:
+                self.progress.emit("Evaluating near field...")
+                if self.surface_type == "spherical":
+                    nf_data = self._evaluate_spherical()
+                else:
+                    nf_data = self._evaluate_planar()
+
+            # Display consumers only need a few significant digits, so
+            # single precision halves the bytes shipped to the GUI
+            if self.precision == 'single':
+                for k in _FIELD_KEYS:
+                    nf_data[k] = nf_data[k].astype(np.complex64, copy=False)
+                # The coordinate axes only feed plot ticks, so they can
+                # drop to float32 along with the fields
+                for k in ('theta', 'phi', 'x', 'y'):
+                    if k in nf_data:
+                        nf_data[k] = nf_data[k].astype(np.float32,
+                                                       copy=False)
+
+            # Very large grids are backed by disk memmaps so the GUI
+            # holds file handles instead of tens of MB per emission;
+            # the panel unlinks the files when the pattern changes
+            if sum(nf_data[k].nbytes for k in _FIELD_KEYS) >= _MEMMAP_MIN_BYTES:
+                files = []
+                for k in _FIELD_KEYS:
+                    mm = _memmap_backed(nf_data[k])
+                    nf_data[k] = mm
+                    files.append(mm.filename)
+                nf_data['memmap_files'] = files
+
+            self.finished.emit(nf_data)
+
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def _evaluate_all_freqs(self):
+        """
+        Evaluate the surface at every SWE frequency, building the
+        coordinate arrays once and stacking the field components into a
+        (nfreq,) + grid_shape output.
+        """
+        frequencies = sorted(self.swes)
+        components = None
+        nf_data = None
+        for i, freq in enumerate(frequencies):
+            self.progress.emit(
+                f"Evaluating near field ({i + 1}/{len(frequencies)})...")
+            self.swe = self.swes[freq]
+            if self.surface_type == "spherical":
+                single = self._evaluate_spherical()
+            else:
+                single = self._evaluate_planar()
+            if nf_data is None:
+                nf_data = single
+                components = {k: [single[k]] for k in _FIELD_KEYS}
+            else:
+                for k in _FIELD_KEYS:
+                    components[k].append(single[k])
+        for k in _FIELD_KEYS:
+            nf_data[k] = np.stack(components[k], axis=0)
+        nf_data['frequencies'] = np.asarray(frequencies)
+        return nf_data
+
+    def _near_field(self, r, theta, phi):
+        """
+        Evaluate swe.near_field, splitting large point sets across a
+        process pool. The evaluation is embarrassingly parallel over
+        points, so chunks are simply concatenated back in order.
+
+        Scalar arguments are accepted and broadcast against the others,
+        so constant coordinates (sphere radius, plane height) never
+        need a full-sized array on the caller's side.
+        """
+        r, theta, phi = np.broadcast_arrays(
+            np.asarray(r, dtype=np.float64), np.asarray(theta),
+            np.asarray(phi))
+        # SWE implementations that ship a compiled batched kernel (numba
+        # or similar) expose it as near_field_fast or near_field_batched;
+        # prefer those and skip the process pool, since such kernels
+        # parallelize internally
+        near_field_fast = getattr(self.swe, 'near_field_fast', None)
+        if near_field_fast is not None:
+            return near_field_fast(r, theta, phi)
+        near_field_batched = getattr(self.swe, 'near_field_batched', None)
+        if near_field_batched is not None:
+            try:
+                return near_field_batched(r, theta, phi, parallel=True)
+            except TypeError:
+                return near_field_batched(r, theta, phi)
+
+        n_workers = max(1, (os.cpu_count() or 2) - 1)
+        if r.size > _PARALLEL_MIN_POINTS and n_workers > 1:
+            # Threads rather than processes: the evaluation is numpy-
+            # heavy and releases the GIL in the inner kernels, and
+            # threads share the SWE object without pickling it
+            try:
+                idx = np.array_split(np.arange(r.size), n_workers)
+                with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                    results = list(pool.map(
+                        lambda i: _nf_chunk(self.swe, r[i], theta[i], phi[i]),
+                        idx
+                    ))
+                e_parts, h_parts = zip(*results)
+                E = tuple(np.concatenate(c) for c in zip(*e_parts))
+                H = tuple(np.concatenate(c) for c in zip(*h_parts))
+                return E, H
+            except Exception:
+                # Evaluators that aren't thread-safe fall back to the
+                # serial path below
+                pass
+
+        n = r.size
+        if n <= _SERIAL_CHUNK:
+            return self.swe.near_field(r, theta, phi)
+
+        # Serial path for large grids: evaluate in tiles written into
+        # preallocated outputs, so the evaluator's working set stays
+        # chunk-sized and the GUI gets progress updates between tiles
+        E = H = None
+        for s in range(0, n, _SERIAL_CHUNK):
+            e = min(s + _SERIAL_CHUNK, n)
+            e_chunk, h_chunk = self.swe.near_field(r[s:e], theta[s:e],
+                                                   phi[s:e])
+            if E is None:
+                E = tuple(np.empty(n, dtype=c.dtype) for c in e_chunk)
+                H = tuple(np.empty(n, dtype=c.dtype) for c in h_chunk)
+            for dst, src in zip(E, e_chunk):
+                dst[s:e] = src
+            for dst, src in zip(H, h_chunk):
+                dst[s:e] = src
+            self.progress.emit(
+                f"Evaluating near field... {e}/{n} points")
+        return E, H
+
+    def _evaluate_spherical(self):
+        """Evaluate the near field on a spherical surface."""
+        params = self.params
+
+        # Create theta and phi arrays (in degrees); phi stops short of
+        # 360 so the grid is uniform on [0, 2pi) and the m-summation can
+        # be evaluated as a DFT (phi=0 and phi=360 are the same cut)
+        theta_deg = np.linspace(0, 180, params['theta_points'])
+        phi_deg = np.linspace(0, 360, params['phi_points'], endpoint=False)
+
+        # Convert to radians
+        theta_rad = np.radians(theta_deg)
+        phi_rad = np.radians(phi_deg)
+
+        shape = (theta_rad.size, phi_rad.size)
+
+        # Fast path: SWE implementations that expose a grid-structured
+        # evaluator factor Y_nm into P_n^m(cos theta) per theta ring times
+        # exp(i m phi) per column, avoiding per-point Legendre evaluation
+        near_field_grid = getattr(self.swe, 'near_field_grid', None)
+        if near_field_grid is not None:
+            # phi comes from linspace, so hint that the m-sum can run as
+            # an FFT along phi, and forward any cached phasor table;
+            # older evaluators without the kwargs still work through
+            # the plain call
+            hints = {'uniform_phi': True}
+            if self.phi_phasor is not None:
+                hints['phi_phasor'] = self.phi_phasor
+            try:
+                (E_r, E_theta, E_phi), (H_r, H_theta, H_phi) = near_field_grid(
+                    params['radius'], theta_rad, phi_rad, **hints
+                )
+            except TypeError:
+                (E_r, E_theta, E_phi), (H_r, H_theta, H_phi) = near_field_grid(
+                    params['radius'], theta_rad, phi_rad
+                )
+        else:
+            # Generic per-point path: build flat coordinate arrays directly
+            # (ij ordering) instead of materializing full 2D meshgrids
+            theta_flat = np.repeat(theta_rad, phi_rad.size)
+            phi_flat = np.tile(phi_rad, theta_rad.size)
+
+            # Constant-radius surfaces let the evaluator tabulate the
+            # radial functions h_n(kr) once for all points; prefer that
+            # specialization when the SWE implementation offers it
+            nf_surface = getattr(self.swe, 'near_field_spherical_surface',
+                                 None)
+            if nf_surface is not None:
+                (E_r, E_theta, E_phi), (H_r, H_theta, H_phi) = nf_surface(
+                    params['radius'], theta_flat, phi_flat
+                )
+            else:
+                # r is constant over the sphere; _near_field broadcasts
+                # the scalar, so no full-sized radius array is built
+                (E_r, E_theta, E_phi), (H_r, H_theta, H_phi) = \
+                    self._near_field(params['radius'], theta_flat, phi_flat)
+
+        return {
+            'E_r': E_r.reshape(shape),
+            'E_theta': E_theta.reshape(shape),
+            'E_phi': E_phi.reshape(shape),
+            'H_r': H_r.reshape(shape),
+            'H_theta': H_theta.reshape(shape),
+            'H_phi': H_phi.reshape(shape),
+            'theta': theta_deg,
+            'phi': phi_deg,
+            'radius': params['radius'],
+            'is_spherical': True
+        }
+
+    def _evaluate_planar(self):
+        """Evaluate the near field on a planar surface."""
+        params = self.params
+
+        # Create x and y arrays
+        x = np.linspace(-params['x_extent'], params['x_extent'], params['x_points'])
+        y = np.linspace(-params['y_extent'], params['y_extent'], params['y_points'])
+
+        # Build flat coordinate arrays directly (ij ordering) instead
+        # of materializing full 2D meshgrids just to ravel them
+        shape = (x.size, y.size)
+        x_flat = np.repeat(x, y.size)
+        y_flat = np.tile(y, x.size)
+        z = params['z_distance']
+
+        # Convert to spherical coordinates inline; z is constant over the
+        # plane so it stays a scalar throughout
+        rho2 = x_flat * x_flat + y_flat * y_flat
+        r = np.sqrt(rho2 + z * z)
+        theta = np.arccos(z / r)
+        phi = np.arctan2(y_flat, x_flat)
+
+        # Evaluate near field in spherical coordinates
+        (E_r, E_theta, E_phi), (H_r, H_theta, H_phi) = self._near_field(r, theta, phi)
+
+        return {
+            'E_r': E_r.reshape(shape),
+            'E_theta': E_theta.reshape(shape),
+            'E_phi': E_phi.reshape(shape),
+            'H_r': H_r.reshape(shape),
+            'H_theta': H_theta.reshape(shape),
+            'H_phi': H_phi.reshape(shape),
+            'x': x,
+            'y': y,
+            'x_extent': params['x_extent'],
+            'y_extent': params['y_extent'],
+            'z_distance': params['z_distance'],
+            'is_spherical': False
+        }
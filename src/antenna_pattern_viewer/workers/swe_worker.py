@@ -1,35 +1,44 @@
 """
-Worker thread for SWE calculations to prevent GUI freezing.
+Worker for SWE calculations to prevent GUI freezing.
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 
-class SWEWorker(QThread):
-    """Worker thread for calculating spherical wave expansion."""
-    
-    # Signals
+class SWEWorkerSignals(QObject):
+    """Signal holder for SWEWorker (QRunnable cannot define signals)."""
+
     finished = pyqtSignal(object)  # Emits SWE object when done
     error = pyqtSignal(str)  # Emits error message
     progress = pyqtSignal(str)  # Emits progress messages
-    
+
+
+class SWEWorker(QRunnable):
+    """
+    Worker for calculating spherical wave expansion.
+
+    Runs on the global QThreadPool, so repeated calculations reuse warm
+    threads instead of paying QThread construction/teardown per click.
+    """
+
     def __init__(self, pattern, frequency, nmax=None, mmax=None):
         super().__init__()
         self.pattern = pattern
         self.frequency = frequency
         self.nmax = nmax
         self.mmax = mmax
+        self.signals = SWEWorkerSignals()
 
     def run(self):
-        """Run the calculation in background thread."""
+        """Run the calculation on a pool thread."""
         try:
-            self.progress.emit("Calculating spherical modes...")
+            self.signals.progress.emit("Calculating spherical modes...")
             swe = self.pattern.calculate_spherical_modes(
                 frequency=self.frequency,
                 nmax=self.nmax,
                 mmax=self.mmax
             )
-            self.finished.emit(swe)
-            
+            self.signals.finished.emit(swe)
+
         except Exception as e:
-            self.error.emit(str(e))
\ No newline at end of file
+            self.signals.error.emit(str(e))